@@ -0,0 +1,116 @@
+"""
+Startup Benchmark
+Measures import cost and time to first paint of Budget Manager Pro
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N] [--top N]
+
+Import cost is measured with `python -X importtime`. Time to first paint
+starts the real application in a fresh interpreter, processes pending
+Tk events once and reports how long that took from interpreter start. It
+also lists which heavy dependencies were already imported at that point,
+none of which should be needed to show the Dashboard.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Mirrors main.py's path setup
+PATH_SETUP = (
+    "import sys, os; "
+    f"sys.path.insert(0, {ROOT_DIR!r}); "
+    f"sys.path.insert(0, os.path.join({ROOT_DIR!r}, 'src')); "
+)
+
+# Dependencies that should be deferred until a feature needs them
+HEAVY_MODULES = ['matplotlib', 'sklearn', 'tkcalendar', 'scipy']
+
+FIRST_PAINT_SCRIPT = PATH_SETUP + """
+import time
+start = time.perf_counter()
+import json
+from src.app import BudgetApp
+imported = time.perf_counter()
+app = BudgetApp()
+app.root.update()
+painted = time.perf_counter()
+heavy = sorted(name for name in %r if name in sys.modules)
+app.root.destroy()
+print(json.dumps({'import_s': imported - start, 'first_paint_s': painted - start,
+                  'heavy_modules_loaded': heavy}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_import_time(top):
+    """Run `-X importtime` on the app module and return the slowest imports"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', PATH_SETUP + 'import src.app'],
+        cwd=ROOT_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        entries.append((name.rstrip()[1:], int(self_us), int(cumulative_us)))
+
+    # Only top-level imports (no indentation) add up to the total
+    top_level = [entry for entry in entries if not entry[0].startswith(' ')]
+    total_us = sum(cumulative for _, _, cumulative in top_level)
+    slowest = sorted(entries, key=lambda entry: entry[2], reverse=True)[:top]
+    heavy = sorted({entry[0].strip().split('.')[0] for entry in entries} & set(HEAVY_MODULES))
+    return total_us, slowest, heavy
+
+
+def measure_first_paint(runs):
+    """Start the app `runs` times and collect time-to-first-paint samples"""
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, '-c', FIRST_PAINT_SCRIPT],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=3, help='first-paint runs to average')
+    parser.add_argument('--top', type=int, default=15, help='slowest imports to list')
+    args = parser.parse_args()
+
+    total_us, slowest, heavy = measure_import_time(args.top)
+    print(f"Import time of src.app: {total_us / 1000:.1f} ms")
+    print(f"Heavy modules imported eagerly: {', '.join(heavy) or 'none'}")
+    print("\nSlowest imports (cumulative):")
+    for name, self_us, cumulative_us in slowest:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name.strip()}")
+
+    try:
+        samples = measure_first_paint(args.runs)
+    except RuntimeError as e:
+        # Needs a display; import timings above are still valid
+        print(f"\nTime to first paint: unavailable ({e})")
+        return
+
+    paint_times = [sample['first_paint_s'] * 1000 for sample in samples]
+    print(f"\nTime to first paint over {len(samples)} runs: "
+          f"median {statistics.median(paint_times):.0f} ms, "
+          f"min {min(paint_times):.0f} ms, max {max(paint_times):.0f} ms")
+    loaded = samples[-1]['heavy_modules_loaded']
+    print(f"Heavy modules loaded at first paint: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == '__main__':
+    main()
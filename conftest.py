@@ -0,0 +1,5 @@
+"""
+Pytest configuration
+Being in the repository root, this file puts the root on sys.path so the
+tests can import the utils package when run with a bare `pytest`.
+"""
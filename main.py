@@ -4,6 +4,7 @@ Main entry point for the application
 """
 import sys
 import os
+import multiprocessing
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -11,5 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.app import BudgetApp
 
 if __name__ == "__main__":
+    # Imports parse several files in worker processes, which a frozen build must support
+    multiprocessing.freeze_support()
     app = BudgetApp()
     app.run()
@@ -5,13 +5,20 @@ Manages the tkinter application lifecycle
 import tkinter as tk
 from tkinter import messagebox
 from gui.main_window import MainWindow
+from gui.io_executor import IOExecutor
 from utils.config_manager import ConfigManager
 from utils.database_manager import DatabaseManager
 import os
+import time
 
 class BudgetApp:
     """Main application controller"""
     
+    # How often pending journal entries are folded into the workbook
+    COMPACT_INTERVAL_MS = 5 * 60 * 1000
+    # How long the I/O thread must have been idle before compacting
+    COMPACT_QUIET_MS = 30 * 1000
+    
     def __init__(self):
         """Initialize the application"""
         self.root = tk.Tk()
@@ -26,14 +33,23 @@ class BudgetApp:
         
         # Initialize managers
         self.config_manager = ConfigManager()
-        self.db_manager = DatabaseManager()
+        self.db_manager = DatabaseManager(self.config_manager.get_storage_backend())
+        
+        # Database work runs on a worker thread so the window stays responsive
+        self.io_executor = IOExecutor(self.root)
+        self._last_io_activity = time.monotonic()
+        self.io_executor.add_busy_listener(self._on_io_busy_changed)
         
         # Create main window
-        self.main_window = MainWindow(self.root, self.config_manager, self.db_manager)
+        self.main_window = MainWindow(self.root, self.config_manager, self.db_manager,
+                                      self.io_executor)
         
         # Set up close protocol
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
+        # Periodically compact the transaction journal once database work is quiet
+        self.root.after(self.COMPACT_INTERVAL_MS, self._schedule_compaction)
+        
     def _center_window(self):
         """Center the window on screen"""
         self.root.update_idletasks()
@@ -43,9 +59,33 @@ class BudgetApp:
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
         
+    def _on_io_busy_changed(self, busy):
+        """Remember when database work last started or finished"""
+        self._last_io_activity = time.monotonic()
+        
+    def _schedule_compaction(self):
+        """Compact the journal on the I/O thread once it has been quiet, then reschedule"""
+        idle_ms = (time.monotonic() - self._last_io_activity) * 1000
+        if self.io_executor.is_busy() or idle_ms < self.COMPACT_QUIET_MS:
+            # Don't queue a full rewrite behind the user's work, try again shortly
+            self.root.after(self.COMPACT_QUIET_MS, self._schedule_compaction)
+            return
+        self.io_executor.submit(self._compact_journal)
+        self.root.after(self.COMPACT_INTERVAL_MS, self._schedule_compaction)
+        
+    def _compact_journal(self):
+        """Fold journaled changes into the transactions file"""
+        try:
+            self.db_manager.compact()
+        except Exception as e:
+            print(f"Error compacting transactions: {e}")
+        
     def _on_closing(self):
         """Handle application closing"""
         if messagebox.askokcancel("Quit", "Do you want to quit Budget Manager?"):
+            # Let pending writes finish before the final compaction
+            self.io_executor.shutdown()
+            self._compact_journal()
             self.root.destroy()
             
     def run(self):
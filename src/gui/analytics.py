@@ -3,25 +3,22 @@ Analytics Tab - Charts and reports
 """
 import tkinter as tk
 from tkinter import ttk
-from datetime import datetime, timedelta
-import calendar
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 import sys
 import os
 
 # Add utils to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from utils.predictor import FinancialPredictor
+from utils.periods import last_n_months, month_label
 
 class AnalyticsTab:
     """Analytics and reporting tab"""
     
-    def __init__(self, parent, config_manager, db_manager, colors):
+    def __init__(self, parent, config_manager, db_manager, colors, io_executor):
         self.config_manager = config_manager
         self.db_manager = db_manager
         self.colors = colors
+        self.io_executor = io_executor
         
         # Initialize predictor
         self.predictor = FinancialPredictor(db_manager)
@@ -69,6 +66,8 @@ class AnalyticsTab:
         padding = tk.Frame(content_frame, bg=self.colors['bg'], height=20)
         padding.pack(fill="x")
         
+        # Sections are built once here, refreshes only update their widgets
+        
         # ML Prediction section
         self._create_prediction_section(content_frame)
         
@@ -90,8 +89,55 @@ class AnalyticsTab:
         # Visual charts
         self._create_visual_charts(content_frame)
         
+        # Fill in the data sections and the chart
+        self._refresh_analytics()
+        
+    def _update_sections(self, data):
+        """Show results computed by _compute_analytics() in the existing sections"""
+        self._update_prediction_section(data)
+        self._update_statistics_summary(data)
+        self._update_category_breakdown(data)
+        self._update_monthly_trends(data)
+        self._update_spending_insights(data)
+        
+    def _compute_analytics(self, period):
+        """Compute everything the data sections show; runs on the I/O thread
+        
+        Only queries and the predictor run here, no widgets are touched.
+        Errors from the prediction and trend are returned as text so the
+        other sections still show.
+        """
+        # The typed transactions are loaded once and shared with the predictor
+        transactions_df = self.db_manager.get_transactions_frame()
+        data = {'prediction': None, 'prediction_error': None,
+                'trend': [], 'trend_error': None}
+        
+        try:
+            data['prediction'] = self.predictor.predict_month_survival(transactions_df)
+        except Exception as e:
+            data['prediction_error'] = str(e)
+        try:
+            data['trend'] = self.predictor.get_spending_trend(months=6, df=transactions_df)
+        except Exception as e:
+            data['trend_error'] = str(e)
+        
+        transactions = self.db_manager.get_filtered_transactions(period, as_columns=True)
+        is_expense = transactions['type'] == 'expense'
+        is_income = transactions['type'] == 'income'
+        data['overview'] = {
+            'has_expenses': bool(is_expense.any()),
+            'has_income': bool(is_income.any()),
+            'expenses': float(transactions['amount'][is_expense].sum()),
+            'income': float(transactions['amount'][is_income].sum())
+        }
+        data['stats'] = self._get_statistics(transactions)
+        data['month_income'] = self.db_manager.get_current_month_income()
+        data['monthly'] = self._get_monthly_trends()
+        data['insights'] = self._generate_insights(data['stats'])
+        return data
+        
     def _create_prediction_section(self, parent):
-        """Create ML prediction section"""
+        """Create ML prediction section, filled in by _update_prediction_section()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="x", padx=30, pady=20)
         
@@ -108,92 +154,116 @@ class AnalyticsTab:
         pred_card.pack(fill="both", expand=True)
         pred_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
         
-        # Get prediction
-        try:
-            prediction = self.predictor.predict_month_survival()
-            
-            # Main message with color coding
-            message_color = self.colors['success'] if prediction['can_survive'] else self.colors['danger']
-            
-            message_frame = tk.Frame(pred_card, bg=message_color)
-            message_frame.pack(fill="x", padx=2, pady=2)
-            
-            message_label = tk.Label(message_frame,
-                                    text=prediction['message'],
-                                    bg=message_color,
-                                    fg=self.colors['white'],
-                                    font=('Segoe UI', 13, 'bold'),
-                                    wraplength=700,
-                                    pady=20)
-            message_label.pack(fill="x", padx=20)
-            
-            # Details frame
-            details_frame = tk.Frame(pred_card, bg=self.colors['card'])
-            details_frame.pack(fill="both", expand=True, padx=30, pady=20)
-            
-            # Confidence score
-            confidence_frame = tk.Frame(details_frame, bg=self.colors['card'])
-            confidence_frame.pack(fill="x", pady=10)
-            
-            conf_label = tk.Label(confidence_frame,
-                                 text=f"Confidence Score: {prediction['confidence']:.1f}%",
-                                 bg=self.colors['card'],
-                                 fg=self.colors['primary'],
-                                 font=('Segoe UI', 12, 'bold'))
-            conf_label.pack(side="left")
-            
-            # Confidence bar
-            bar_bg = tk.Frame(confidence_frame, bg=self.colors['light'], height=15, width=200)
-            bar_bg.pack(side="left", padx=15)
-            
-            bar_fill = tk.Frame(bar_bg, bg=message_color, height=15)
-            bar_fill.place(x=0, y=0, relwidth=prediction['confidence']/100, relheight=1)
-            
-            # Trend comparison
-            if prediction['trend']:
-                trend_label = tk.Label(details_frame,
-                                      text=f"📊 Trend: {prediction['trend']}",
-                                      bg=self.colors['card'],
-                                      fg=self.colors['dark'],
-                                      font=('Segoe UI', 10))
-                trend_label.pack(anchor='w', pady=5)
-            
-            # Detailed breakdown
-            details = prediction.get('details', {})
-            if details:
-                # Create a grid for detailed info
-                info_grid = tk.Frame(details_frame, bg=self.colors['card'])
-                info_grid.pack(fill="x", pady=15)
-                
-                # Current balance
-                self._create_detail_row(info_grid, "Current Balance:", 
-                                       f"${details.get('current_balance', 0):,.2f}", 0)
-                
-                # Daily average expense
-                self._create_detail_row(info_grid, "Avg. Daily Expense:", 
-                                       f"${details.get('daily_avg_expense', 0):.2f}", 1)
-                
-                # Daily average income
-                self._create_detail_row(info_grid, "Avg. Daily Income:", 
-                                       f"${details.get('daily_avg_income', 0):.2f}", 2)
-                
-                # Projected end balance
-                proj_balance = details.get('projected_balance', 0)
-                proj_color = self.colors['success'] if proj_balance >= 0 else self.colors['danger']
-                self._create_detail_row(info_grid, "Projected Month-End Balance:", 
-                                       f"${proj_balance:,.2f}", 3, value_color=proj_color)
-                
-        except Exception as e:
-            error_label = tk.Label(pred_card,
-                                  text=f"Unable to generate prediction: {str(e)}",
-                                  bg=self.colors['card'],
-                                  fg=self.colors['danger'],
-                                  font=('Segoe UI', 10),
-                                  pady=30)
-            error_label.pack()
+        # Main message with color coding
+        self.prediction_message_frame = tk.Frame(pred_card, bg=self.colors['light'])
+        self.prediction_message = tk.Label(self.prediction_message_frame,
+                                           text="Loading prediction...",
+                                           bg=self.colors['light'],
+                                           fg=self.colors['dark'],
+                                           font=('Segoe UI', 13, 'bold'),
+                                           wraplength=700,
+                                           pady=20)
+        self.prediction_message.pack(fill="x", padx=20)
+        
+        # Details frame
+        self.prediction_details = tk.Frame(pred_card, bg=self.colors['card'])
+        
+        # Confidence score
+        confidence_frame = tk.Frame(self.prediction_details, bg=self.colors['card'])
+        confidence_frame.pack(fill="x", pady=10)
+        
+        self.confidence_label = tk.Label(confidence_frame,
+                                         bg=self.colors['card'],
+                                         fg=self.colors['primary'],
+                                         font=('Segoe UI', 12, 'bold'))
+        self.confidence_label.pack(side="left")
+        
+        # Confidence bar
+        bar_bg = tk.Frame(confidence_frame, bg=self.colors['light'], height=15, width=200)
+        bar_bg.pack(side="left", padx=15)
+        
+        self.confidence_bar = tk.Frame(bar_bg, bg=self.colors['light'], height=15)
+        self.confidence_bar.place(x=0, y=0, relwidth=0, relheight=1)
+        
+        # Trend comparison, shown when there is one
+        self.prediction_trend = tk.Label(self.prediction_details,
+                                         bg=self.colors['card'],
+                                         fg=self.colors['dark'],
+                                         font=('Segoe UI', 10))
+        
+        # Detailed breakdown
+        self.prediction_grid = tk.Frame(self.prediction_details, bg=self.colors['card'])
+        self.prediction_rows = {
+            'current_balance': self._create_detail_row(self.prediction_grid, "Current Balance:", "", 0),
+            'daily_expense': self._create_detail_row(self.prediction_grid, "Avg. Daily Expense:", "", 1),
+            'daily_income': self._create_detail_row(self.prediction_grid, "Avg. Daily Income:", "", 2),
+            'projected_balance': self._create_detail_row(self.prediction_grid,
+                                                         "Projected Month-End Balance:", "", 3),
+            'interval': self._create_detail_row(self.prediction_grid, "90% Prediction Interval:", "", 4)
+        }
+        
+        self.prediction_error = tk.Label(pred_card,
+                                         bg=self.colors['card'],
+                                         fg=self.colors['danger'],
+                                         font=('Segoe UI', 10),
+                                         pady=30)
+        self.prediction_message_frame.pack(fill="x", padx=2, pady=2)
+        
+    def _update_prediction_section(self, data):
+        """Show the prediction computed on the I/O thread"""
+        for widget in (self.prediction_message_frame, self.prediction_details,
+                       self.prediction_error, self.prediction_trend, self.prediction_grid):
+            widget.pack_forget()
+        
+        if data['prediction_error'] is not None:
+            self.prediction_error.configure(
+                text=f"Unable to generate prediction: {data['prediction_error']}"
+            )
+            self.prediction_error.pack()
+            return
+        prediction = data['prediction']
+        
+        message_color = self.colors['success'] if prediction['can_survive'] else self.colors['danger']
+        self.prediction_message_frame.configure(bg=message_color)
+        self.prediction_message.configure(text=prediction['message'], bg=message_color,
+                                          fg=self.colors['white'])
+        self.prediction_message_frame.pack(fill="x", padx=2, pady=2)
+        self.prediction_details.pack(fill="both", expand=True, padx=30, pady=20)
+        
+        self.confidence_label.configure(text=f"Confidence Score: {prediction['confidence']:.1f}%")
+        self.confidence_bar.configure(bg=message_color)
+        self.confidence_bar.place_configure(relwidth=prediction['confidence'] / 100)
+        
+        if prediction.get('trend'):
+            self.prediction_trend.configure(text=f"📊 Trend: {prediction['trend']}")
+            self.prediction_trend.pack(anchor='w', pady=5)
+        
+        details = prediction.get('details', {})
+        if not details:
+            return
+        self.prediction_grid.pack(fill="x", pady=15)
+        
+        rows = self.prediction_rows
+        rows['current_balance'][1].configure(text=f"${details.get('current_balance', 0):,.2f}")
+        rows['daily_expense'][1].configure(text=f"${details.get('daily_expense_avg', 0):.2f}")
+        rows['daily_income'][1].configure(text=f"${details.get('daily_income_avg', 0):.2f}")
+        
+        proj_balance = details.get('projected_balance', 0)
+        proj_color = self.colors['success'] if proj_balance >= 0 else self.colors['danger']
+        rows['projected_balance'][1].configure(text=f"${proj_balance:,.2f}", fg=proj_color)
+        
+        # Regression prediction interval, when enough history exists
+        interval = details.get('balance_interval')
+        for widget in rows['interval']:
+            if interval:
+                widget.grid()
+            else:
+                widget.grid_remove()
+        if interval:
+            rows['interval'][1].configure(text=f"${interval[0]:,.2f} to ${interval[1]:,.2f}")
     
     def _create_detail_row(self, parent, label, value, row, value_color=None):
-        """Create a detail row in prediction section"""
+        """Create a detail row in prediction section, returns its (label, value) widgets"""
         if value_color is None:
             value_color = self.colors['primary']
             
@@ -214,9 +284,10 @@ class AnalyticsTab:
         value_widget.grid(row=row, column=1, sticky='e', pady=5)
         
         parent.grid_columnconfigure(1, weight=1)
+        return label_widget, value_widget
     
     def _create_visual_charts(self, parent):
-        """Create matplotlib charts for trends visualization"""
+        """Create the matplotlib trend chart, filled in by _update_visual_charts()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="both", padx=30, pady=20)
         
@@ -233,62 +304,113 @@ class AnalyticsTab:
         chart_card.pack(fill="both", expand=True)
         chart_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
         
+        self.chart_canvas = None
+        self.chart_message = tk.Label(chart_card,
+                                      bg=self.colors['card'],
+                                      fg=self.colors['dark'],
+                                      font=('Segoe UI', 11),
+                                      pady=40)
+        
         try:
-            # Get trend data
-            trend_data = self.predictor.get_spending_trend(months=6)
+            # matplotlib is imported here, not at module load, to keep startup fast
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.ticker import FuncFormatter
             
-            if trend_data:
-                # Create matplotlib figure
-                fig = Figure(figsize=(10, 5), facecolor='white')
-                ax = fig.add_subplot(111)
-                
-                # Extract data
-                months = [item['month'] for item in trend_data]
-                expenses = [item['expenses'] for item in trend_data]
-                income = [item['income'] for item in trend_data]
-                
-                # Plot lines
-                ax.plot(months, expenses, marker='o', linewidth=2, 
-                       color='#E74C3C', label='Expenses')
-                ax.plot(months, income, marker='s', linewidth=2, 
-                       color='#27AE60', label='Income')
-                
-                # Styling
-                ax.set_xlabel('Month', fontsize=11, fontweight='bold')
-                ax.set_ylabel('Amount ($)', fontsize=11, fontweight='bold')
-                ax.set_title('6-Month Financial Trend', fontsize=13, fontweight='bold', pad=20)
-                ax.legend(loc='upper left', fontsize=10)
-                ax.grid(True, alpha=0.3, linestyle='--')
-                
-                # Format y-axis as currency
-                ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'${x:,.0f}'))
-                
-                # Rotate x-axis labels
-                plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-                
-                fig.tight_layout()
-                
-                # Embed in tkinter
-                canvas = FigureCanvasTkAgg(fig, master=chart_card)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=20)
-            else:
-                no_data = tk.Label(chart_card,
-                                  text="Not enough data to generate trend charts",
-                                  bg=self.colors['card'],
-                                  fg=self.colors['dark'],
-                                  font=('Segoe UI', 11),
-                                  pady=40)
-                no_data.pack()
+            # One figure for the lifetime of the tab, refreshes only change its data
+            self.chart_figure = Figure(figsize=(10, 5), facecolor='white')
+            self.chart_ax = ax = self.chart_figure.add_subplot(111)
+            
+            # The lines are animated so a refresh that keeps the axes can blit
+            # them over the cached background instead of redrawing everything
+            expense_line, = ax.plot([], [], marker='o', linewidth=2,
+                                    color='#E74C3C', label='Expenses', animated=True)
+            income_line, = ax.plot([], [], marker='s', linewidth=2,
+                                   color='#27AE60', label='Income', animated=True)
+            self.chart_lines = (expense_line, income_line)
+            
+            # Styling
+            ax.set_xlabel('Month', fontsize=11, fontweight='bold')
+            ax.set_ylabel('Amount ($)', fontsize=11, fontweight='bold')
+            ax.set_title('6-Month Financial Trend', fontsize=13, fontweight='bold', pad=20)
+            ax.legend(loc='upper left', fontsize=10)
+            ax.grid(True, alpha=0.3, linestyle='--')
+            
+            # Format y-axis as currency
+            ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'${x:,.0f}'))
+            
+            # Embed in tkinter
+            self.chart_canvas = FigureCanvasTkAgg(self.chart_figure, master=chart_card)
+            self.chart_canvas.mpl_connect('draw_event', self._on_chart_draw)
+            self.chart_background = None
+            self.chart_months = None
                 
         except Exception as e:
-            error_label = tk.Label(chart_card,
-                                  text=f"Unable to generate charts: {str(e)}",
-                                  bg=self.colors['card'],
-                                  fg=self.colors['danger'],
-                                  font=('Segoe UI', 10),
-                                  pady=30)
-            error_label.pack()
+            self.chart_message.config(text=f"Unable to generate charts: {str(e)}",
+                                      fg=self.colors['danger'])
+            self.chart_message.pack()
+            
+    def _update_visual_charts(self, data):
+        """Show the 6-month trend in the existing chart"""
+        if self.chart_canvas is None:
+            return
+        
+        chart_widget = self.chart_canvas.get_tk_widget()
+        trend_data = data['trend']
+        if data['trend_error'] is not None:
+            self.chart_message.config(text=f"Unable to generate charts: {data['trend_error']}",
+                                      fg=self.colors['danger'])
+        else:
+            self.chart_message.config(text="Not enough data to generate trend charts",
+                                      fg=self.colors['dark'])
+        
+        if not trend_data:
+            chart_widget.pack_forget()
+            self.chart_message.pack()
+            return
+        self.chart_message.pack_forget()
+        
+        # Extract data
+        months = [item['month'] for item in trend_data]
+        expenses = [item['expenses'] for item in trend_data]
+        income = [item['income'] for item in trend_data]
+        
+        ax = self.chart_ax
+        positions = list(range(len(months)))
+        self.chart_lines[0].set_data(positions, expenses)
+        self.chart_lines[1].set_data(positions, income)
+        
+        old_limits = ax.get_ylim()
+        ax.relim()
+        ax.autoscale_view()
+        
+        if not chart_widget.winfo_manager():
+            chart_widget.pack(fill="both", expand=True, padx=20, pady=20)
+            
+        if months != self.chart_months:
+            # New month labels change the layout, redraw everything
+            self.chart_months = months
+            ax.set_xticks(positions)
+            ax.set_xticklabels(months, rotation=45, horizontalalignment='right')
+            self.chart_figure.tight_layout()
+            self.chart_canvas.draw_idle()
+        elif ax.get_ylim() != old_limits or self.chart_background is None:
+            self.chart_canvas.draw_idle()
+        else:
+            # Same axes: paint just the lines over the cached background
+            self.chart_canvas.restore_region(self.chart_background)
+            self._draw_chart_lines()
+            self.chart_canvas.blit(self.chart_figure.bbox)
+            
+    def _on_chart_draw(self, event):
+        """Cache the background without the lines after a full draw"""
+        self.chart_background = self.chart_canvas.copy_from_bbox(self.chart_figure.bbox)
+        self._draw_chart_lines()
+        
+    def _draw_chart_lines(self):
+        """Draw the animated trend lines onto the canvas"""
+        for line in self.chart_lines:
+            self.chart_ax.draw_artist(line)
         
     def _create_period_selector(self, parent):
         """Create period selection controls"""
@@ -314,20 +436,20 @@ class AnalyticsTab:
         period_combo.pack(side="left")
         period_combo.bind('<<ComboboxSelected>>', lambda e: self._refresh_analytics())
         
-        refresh_btn = tk.Button(selector_frame,
-                               text="🔄 Refresh",
-                               bg=self.colors['secondary'],
-                               fg=self.colors['white'],
-                               font=('Segoe UI', 10, 'bold'),
-                               relief="flat",
-                               cursor="hand2",
-                               command=self._refresh_analytics,
-                               padx=15,
-                               pady=5)
-        refresh_btn.pack(side="left", padx=(15, 0))
+        self.refresh_btn = tk.Button(selector_frame,
+                                    text="🔄 Refresh",
+                                    bg=self.colors['secondary'],
+                                    fg=self.colors['white'],
+                                    font=('Segoe UI', 10, 'bold'),
+                                    relief="flat",
+                                    cursor="hand2",
+                                    command=self._refresh_analytics,
+                                    padx=15,
+                                    pady=5)
+        self.refresh_btn.pack(side="left", padx=(15, 0))
         
     def _create_statistics_summary(self, parent):
-        """Create statistics summary cards"""
+        """Create statistics summary cards, filled in by _update_statistics_summary()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="x", padx=30, pady=20)
         
@@ -343,21 +465,28 @@ class AnalyticsTab:
         stats_container = tk.Frame(section_frame, bg=self.colors['bg'])
         stats_container.pack(fill="x")
         
-        # Get statistics
-        stats = self._get_statistics()
-        
         # Create stat cards
-        self._create_stat_card(stats_container, "Total Transactions", 
-                              str(stats['total_transactions']), "📊", 0)
-        self._create_stat_card(stats_container, "Average Expense", 
-                              f"${stats['avg_expense']:.2f}", "💵", 1)
-        self._create_stat_card(stats_container, "Highest Expense", 
-                              f"${stats['highest_expense']:.2f}", "📈", 2)
-        self._create_stat_card(stats_container, "Total Income", 
-                              f"${self.db_manager.get_current_month_income():.2f}", "💵", 3)
+        self.stat_labels = {
+            'total_transactions': self._create_stat_card(stats_container, "Total Transactions",
+                                                         "...", "📊", 0),
+            'avg_expense': self._create_stat_card(stats_container, "Average Expense",
+                                                  "...", "💵", 1),
+            'highest_expense': self._create_stat_card(stats_container, "Highest Expense",
+                                                      "...", "📈", 2),
+            'month_income': self._create_stat_card(stats_container, "Total Income",
+                                                   "...", "💵", 3)
+        }
+        
+    def _update_statistics_summary(self, data):
+        """Show the period statistics on the stat cards"""
+        stats = data['stats']
+        self.stat_labels['total_transactions'].configure(text=str(stats['total_transactions']))
+        self.stat_labels['avg_expense'].configure(text=f"${stats['avg_expense']:.2f}")
+        self.stat_labels['highest_expense'].configure(text=f"${stats['highest_expense']:.2f}")
+        self.stat_labels['month_income'].configure(text=f"${data['month_income']:.2f}")
         
     def _create_stat_card(self, parent, title, value, icon, index):
-        """Create a small stat card"""
+        """Create a small stat card, returns its value label"""
         card = tk.Frame(parent, bg=self.colors['card'], relief="flat")
         card.grid(row=0, column=index, padx=8, pady=10, sticky="nsew")
         card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
@@ -391,9 +520,10 @@ class AnalyticsTab:
         
         card.configure(height=150)
         card.pack_propagate(False)
+        return value_label
         
     def _create_category_breakdown(self, parent):
-        """Create spending overview chart"""
+        """Create spending overview chart, filled in by _update_category_breakdown()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="both", padx=30, pady=20)
         
@@ -411,39 +541,50 @@ class AnalyticsTab:
         chart_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
         
         # Show simple statistics instead of category breakdown
-        transactions = self.db_manager.get_filtered_transactions(self.period_var.get())
-        expenses = [t for t in transactions if t['type'] == 'expense']
-        income = [t for t in transactions if t['type'] == 'income']
+        self.overview_frame = tk.Frame(chart_card, bg=self.colors['card'])
+        self.overview_rows = {
+            'expenses': self._create_stat_row(self.overview_frame, "Total Expenses",
+                                              self.colors['danger']),
+            'income': self._create_stat_row(self.overview_frame, "Total Income",
+                                            self.colors['success'])
+        }
         
-        if expenses or income:
-            stats_frame = tk.Frame(chart_card, bg=self.colors['card'])
-            stats_frame.pack(fill="both", expand=True, padx=40, pady=30)
-            
-            # Total Expenses
-            if expenses:
-                exp_total = sum(e['amount'] for e in expenses)
-                self._create_stat_row(stats_frame, "Total Expenses", f"${exp_total:,.2f}", 
-                                     self.colors['danger'], exp_total, exp_total if exp_total > 0 else 1)
-            
-            # Total Income
-            if income:
-                inc_total = sum(i['amount'] for i in income)
-                max_val = max(inc_total, sum(e['amount'] for e in expenses) if expenses else 0)
-                self._create_stat_row(stats_frame, "Total Income", f"${inc_total:,.2f}", 
-                                     self.colors['success'], inc_total, max_val if max_val > 0 else 1)
-        else:
-            no_data = tk.Label(chart_card,
-                              text="No data available for the selected period",
-                              bg=self.colors['card'],
-                              fg=self.colors['dark'],
-                              font=('Segoe UI', 11),
-                              pady=40)
-            no_data.pack()
+        self.overview_empty = tk.Label(chart_card,
+                                       text="No data available for the selected period",
+                                       bg=self.colors['card'],
+                                       fg=self.colors['dark'],
+                                       font=('Segoe UI', 11),
+                                       pady=40)
+        
+    def _update_category_breakdown(self, data):
+        """Show the period's expense and income totals as bars"""
+        overview = data['overview']
+        exp_total = overview['expenses']
+        inc_total = overview['income']
+        
+        self.overview_frame.pack_forget()
+        self.overview_empty.pack_forget()
+        if not (overview['has_expenses'] or overview['has_income']):
+            self.overview_empty.pack()
+            return
+        self.overview_frame.pack(fill="both", expand=True, padx=40, pady=30)
+        
+        # Expenses fill their bar, income is scaled against the larger total
+        max_val = max(inc_total, exp_total) if overview['has_income'] else exp_total
+        for key, shown, amount in (('expenses', overview['has_expenses'], exp_total),
+                                   ('income', overview['has_income'], inc_total)):
+            row_frame, bar_fill, value_widget = self.overview_rows[key]
+            row_frame.pack_forget()
+            if not shown:
+                continue
+            scale = (exp_total if key == 'expenses' else max_val) or 1
+            bar_fill.place_configure(relwidth=amount / scale)
+            value_widget.configure(text=f"${amount:,.2f}")
+            row_frame.pack(fill="x", pady=12)
     
-    def _create_stat_row(self, parent, label, value, color, amount, max_amount):
-        """Create a statistics row with bar"""
+    def _create_stat_row(self, parent, label, color):
+        """Create a statistics row with bar, returns its (frame, bar, value label)"""
         row_frame = tk.Frame(parent, bg=self.colors['card'])
-        row_frame.pack(fill="x", pady=12)
         
         # Label
         label_widget = tk.Label(row_frame,
@@ -459,27 +600,22 @@ class AnalyticsTab:
         bar_bg = tk.Frame(row_frame, bg=self.colors['light'], height=30)
         bar_bg.pack(side="left", fill="x", expand=True)
         
-        # Filled bar
-        if max_amount > 0:
-            percentage = (amount / max_amount) * 100
-        else:
-            percentage = 0
-            
+        # Filled bar, sized by _update_category_breakdown()
         bar_fill = tk.Frame(bar_bg, bg=color, height=30)
-        bar_fill.place(x=0, y=0, relwidth=percentage/100, relheight=1)
+        bar_fill.place(x=0, y=0, relwidth=0, relheight=1)
         
         # Value label
         value_widget = tk.Label(row_frame,
-                               text=value,
                                bg=self.colors['card'],
                                fg=color,
                                font=('Segoe UI', 11, 'bold'),
                                width=15,
                                anchor='e')
         value_widget.pack(side="right", padx=(15, 0))
+        return row_frame, bar_fill, value_widget
         
     def _create_monthly_trends(self, parent):
-        """Create monthly trends section"""
+        """Create monthly trends section, filled in by _update_monthly_trends()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="both", padx=30, pady=20)
         
@@ -496,71 +632,54 @@ class AnalyticsTab:
         trends_card.pack(fill="both", expand=True)
         trends_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
         
-        # Get monthly data
-        monthly_data = self._get_monthly_trends()
-        
-        if monthly_data:
-            # Create simple line chart representation
-            chart_frame = tk.Frame(trends_card, bg=self.colors['card'])
-            chart_frame.pack(fill="both", expand=True, padx=30, pady=20)
+        # Create simple line chart representation, one bar per month
+        chart_frame = tk.Frame(trends_card, bg=self.colors['card'])
+        chart_frame.pack(fill="both", expand=True, padx=30, pady=20)
+        self.trend_bars = [self._create_trend_bar(chart_frame) for _ in range(6)]
+        
+    def _update_monthly_trends(self, data):
+        """Resize the trend bars for the last 6 months' totals"""
+        monthly_data = data['monthly']
+        max_value = max(monthly_data.values()) if monthly_data else 0
+        
+        for (bar, amount_label, month_text), (month, amount) in zip(self.trend_bars,
+                                                                    monthly_data.items()):
+            # Calculate height fraction, the bar grows from the bottom
+            height = amount / max_value if max_value > 0 else 0
+            bar.place_configure(rely=1 - height, relheight=height)
+            amount_label.configure(text=f"${amount:,.0f}")
+            month_text.configure(text=month)
             
-            max_value = max(monthly_data.values()) if monthly_data else 0
-            
-            for month, amount in monthly_data.items():
-                self._create_trend_bar(chart_frame, month, amount, max_value)
-        else:
-            no_data = tk.Label(trends_card,
-                              text="No trend data available",
-                              bg=self.colors['card'],
-                              fg=self.colors['dark'],
-                              font=('Segoe UI', 11),
-                              pady=40)
-            no_data.pack()
-            
-    def _create_trend_bar(self, parent, month, amount, max_value):
-        """Create a trend bar for monthly data"""
+    def _create_trend_bar(self, parent):
+        """Create a trend bar, returns its (bar, amount label, month label)"""
         bar_container = tk.Frame(parent, bg=self.colors['card'])
         bar_container.pack(side="left", fill="both", expand=True, padx=5)
         
-        # Calculate height percentage
-        if max_value > 0:
-            height_pct = (amount / max_value) * 100
-        else:
-            height_pct = 0
-            
-        # Bar (inverted - grows from bottom)
         bar_frame = tk.Frame(bar_container, bg=self.colors['card'], height=200)
         bar_frame.pack(fill="x")
         bar_frame.pack_propagate(False)
         
-        # Spacer (creates bottom-up effect)
-        spacer_height = int(200 * (1 - height_pct / 100))
-        if spacer_height > 0:
-            spacer = tk.Frame(bar_frame, bg=self.colors['card'], height=spacer_height)
-            spacer.pack(side="top", fill="x")
-        
-        # Actual bar
+        # Actual bar, placed against the bottom of its frame
         bar = tk.Frame(bar_frame, bg=self.colors['secondary'])
-        bar.pack(side="top", fill="both", expand=True)
+        bar.place(relx=0, rely=1, relwidth=1, relheight=0)
         
         # Amount on top
         amount_label = tk.Label(bar_container,
-                               text=f"${amount:,.0f}",
                                bg=self.colors['card'],
                                fg=self.colors['dark'],
                                font=('Segoe UI', 9, 'bold'))
         amount_label.pack(pady=5)
         
         # Month label
-        month_label = tk.Label(bar_container,
-                              text=month,
+        month_text = tk.Label(bar_container,
                               bg=self.colors['card'],
                               fg=self.colors['dark'],
                               font=('Segoe UI', 9))
-        month_label.pack()
+        month_text.pack()
+        return bar, amount_label, month_text
         
     def _create_spending_insights(self, parent):
-        """Create spending insights section"""
+        """Create spending insights section, filled in by _update_spending_insights()"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
         section_frame.pack(fill="both", padx=30, pady=20)
         
@@ -573,42 +692,54 @@ class AnalyticsTab:
         title.pack(fill="x", pady=(0, 10))
         
         # Insights container
-        insights_card = tk.Frame(section_frame, bg=self.colors['card'], relief="flat")
-        insights_card.pack(fill="both", expand=True)
-        insights_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
-        
-        # Get insights
-        insights = self._generate_insights()
-        
-        for i, insight in enumerate(insights):
-            insight_frame = tk.Frame(insights_card, bg=self.colors['card'])
-            insight_frame.pack(fill="x", padx=30, pady=12)
-            
-            # Bullet point
-            bullet = tk.Label(insight_frame,
-                            text="•",
-                            bg=self.colors['card'],
-                            fg=self.colors['secondary'],
-                            font=('Segoe UI', 16, 'bold'))
-            bullet.pack(side="left", padx=(0, 10))
-            
-            # Insight text
-            text = tk.Label(insight_frame,
-                          text=insight,
-                          bg=self.colors['card'],
-                          fg=self.colors['dark'],
-                          font=('Segoe UI', 10),
-                          wraplength=550,
-                          justify='left',
-                          anchor='w')
-            text.pack(side="left", fill="x", expand=True)
+        self.insights_card = tk.Frame(section_frame, bg=self.colors['card'], relief="flat")
+        self.insights_card.pack(fill="both", expand=True)
+        self.insights_card.configure(highlightbackground="#e0e0e0", highlightthickness=1)
+        
+        # Rows are created as needed and reused, extra ones are hidden
+        self.insight_rows = []
+        
+    def _update_spending_insights(self, data):
+        """Show the insights, reusing the existing rows"""
+        insights = data['insights']
+        while len(self.insight_rows) < len(insights):
+            self.insight_rows.append(self._create_insight_row(self.insights_card))
+        
+        for i, (insight_frame, text) in enumerate(self.insight_rows):
+            # Rows stay in creation order, so repacking shown ones keeps it
+            insight_frame.pack_forget()
+            if i < len(insights):
+                text.configure(text=insights[i])
+                insight_frame.pack(fill="x", padx=30, pady=12)
+                
+    def _create_insight_row(self, parent):
+        """Create an insight row, returns its (frame, text label)"""
+        insight_frame = tk.Frame(parent, bg=self.colors['card'])
+        
+        # Bullet point
+        bullet = tk.Label(insight_frame,
+                        text="•",
+                        bg=self.colors['card'],
+                        fg=self.colors['secondary'],
+                        font=('Segoe UI', 16, 'bold'))
+        bullet.pack(side="left", padx=(0, 10))
+        
+        # Insight text
+        text = tk.Label(insight_frame,
+                      bg=self.colors['card'],
+                      fg=self.colors['dark'],
+                      font=('Segoe UI', 10),
+                      wraplength=550,
+                      justify='left',
+                      anchor='w')
+        text.pack(side="left", fill="x", expand=True)
+        return insight_frame, text
             
-    def _get_statistics(self):
-        """Get statistical data"""
-        transactions = self.db_manager.get_filtered_transactions(self.period_var.get())
-        expenses = [t for t in transactions if t['type'] == 'expense']
+    def _get_statistics(self, transactions):
+        """Get statistical data for the selected period's transactions"""
+        amounts = transactions['amount'][transactions['type'] == 'expense']
         
-        if not expenses:
+        if not amounts.size:
             return {
                 'total_transactions': 0,
                 'avg_expense': 0,
@@ -616,40 +747,27 @@ class AnalyticsTab:
                 'top_category': 'N/A'
             }
         
-        amounts = [e['amount'] for e in expenses]
-        
         return {
-            'total_transactions': len(expenses),
-            'avg_expense': sum(amounts) / len(amounts),
-            'highest_expense': max(amounts),
+            'total_transactions': int(amounts.size),
+            'avg_expense': float(amounts.mean()),
+            'highest_expense': float(amounts.max()),
             'top_category': 'General'  # Since we removed categories
         }
         
     def _get_monthly_trends(self):
         """Get last 6 months trends"""
         trends = {}
-        today = datetime.now()
         
-        for i in range(6):
-            month_date = today - timedelta(days=30 * i)
-            month_name = month_date.strftime('%b')
-            
-            # Get transactions for this month
-            month_total = self.db_manager.get_month_total(
-                month_date.year, 
-                month_date.month
-            )
-            trends[month_name] = month_total
+        # Exact calendar months, oldest first, read from the monthly rollup
+        for year, month in last_n_months(6):
+            trends[month_label(year, month, '%b')] = self.db_manager.get_month_total(year, month)
             
-        # Reverse to show oldest first
-        return dict(reversed(list(trends.items())))
+        return trends
         
-    def _generate_insights(self):
-        """Generate spending insights"""
+    def _generate_insights(self, stats):
+        """Generate spending insights from the period statistics"""
         insights = []
         
-        stats = self._get_statistics()
-        
         if stats['total_transactions'] > 0:
             insights.append(f"You've made {stats['total_transactions']} transactions in this period.")
             insights.append(f"Your average expense is ${stats['avg_expense']:.2f}.")
@@ -670,7 +788,34 @@ class AnalyticsTab:
         
     def _refresh_analytics(self):
         """Refresh all analytics data"""
-        # Rebuild the entire UI
-        for widget in self.frame.winfo_children():
-            widget.destroy()
-        self._build_ui()
+        # Queries and the predictor run on the I/O thread, the sections are
+        # updated once their results arrive
+        self.refresh_btn.config(state="disabled", text="⏳ Loading...")
+        self.frame.config(cursor="watch")
+        self.io_executor.submit(self._compute_analytics, self.period_var.get(),
+                                on_done=self._show_analytics,
+                                on_error=self._show_load_error)
+        
+    def _show_analytics(self, data):
+        """Update the data sections and the chart from computed results"""
+        self._update_sections(data)
+        self._update_visual_charts(data)
+        self._end_loading()
+        
+    def _show_load_error(self, error):
+        """Report a failed load and leave the previous analytics in place"""
+        print(f"Error loading analytics data: {error}")
+        self._end_loading()
+        
+    def _end_loading(self):
+        """Leave the busy state entered by _refresh_analytics()"""
+        self.refresh_btn.config(state="normal", text="🔄 Refresh")
+        self.frame.config(cursor="")
+        
+    def refresh_data(self):
+        """Refresh analytics after the data changed while the tab was hidden"""
+        self._refresh_analytics()
+        
+    def on_data_changed(self, event):
+        """Update analytics for a data change event"""
+        self._refresh_analytics()
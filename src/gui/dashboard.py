@@ -8,10 +8,14 @@ import datetime
 class DashboardTab:
     """Dashboard showing financial overview"""
     
-    def __init__(self, parent, config_manager, db_manager, colors, notebook=None):
+    # Number of rows in the Recent Transactions list
+    RECENT_LIMIT = 5
+    
+    def __init__(self, parent, config_manager, db_manager, colors, io_executor, notebook=None):
         self.config_manager = config_manager
         self.db_manager = db_manager
         self.colors = colors
+        self.io_executor = io_executor
         self.notebook = notebook  # Store notebook reference for tab switching
         
         # Create main frame
@@ -78,46 +82,41 @@ class DashboardTab:
         # Quick actions
         self._create_quick_actions()
         
+        # Fill the cards and rows built above
+        self.refresh_data()
+        
     def _create_summary_cards(self):
         """Create summary cards showing key metrics"""
         cards_container = tk.Frame(self.content_frame, bg=self.colors['bg'])
         cards_container.pack(fill="x", padx=30, pady=10)
         
-        # Get current month data
-        current_month_expenses = self.db_manager.get_current_month_total()
-        current_month_income = self.db_manager.get_current_month_income()
+        # Values are filled in by _update_summary_cards() once loaded
+        self.card_labels = {
+            'expenses': self._create_card(cards_container, "Total Expenses", "Loading...",
+                                          self.colors['danger'], 0, 0),
+            'income': self._create_card(cards_container, "Total Income", "Loading...",
+                                        self.colors['success'], 0, 1),
+            'balance': self._create_card(cards_container, "Balance", "Loading...",
+                                         self.colors['success'], 1, 0),
+            'budget': self._create_card(cards_container, "Budget Remaining", "Loading...",
+                                        self.colors['warning'], 1, 1)
+        }
+        
+    def _update_summary_cards(self, snapshot):
+        """Show the current month's totals on the summary cards"""
+        current_month_expenses = snapshot['expenses']
+        current_month_income = snapshot['income']
         balance = current_month_income - current_month_expenses
         budget = self.config_manager.get_monthly_budget()
         budget_remaining = budget - current_month_expenses if budget > 0 else 0
         
-        # Card 1: Monthly Expenses
-        self._create_card(cards_container, 
-                         "Total Expenses",
-                         f"${current_month_expenses:,.2f}",
-                         self.colors['danger'],
-                         0, 0)
-        
-        # Card 2: Monthly Income
-        self._create_card(cards_container,
-                         "Total Income",
-                         f"${current_month_income:,.2f}",
-                         self.colors['success'],
-                         0, 1)
-        
-        # Card 3: Balance
         balance_color = self.colors['success'] if balance >= 0 else self.colors['danger']
-        self._create_card(cards_container,
-                         "Balance",
-                         f"${balance:,.2f}",
-                         balance_color,
-                         1, 0)
-        
-        # Card 4: Budget Remaining
-        self._create_card(cards_container,
-                         "Budget Remaining",
-                         f"${budget_remaining:,.2f}" if budget > 0 else "No Budget Set",
-                         self.colors['warning'],
-                         1, 1)
+        self.card_labels['expenses'].configure(text=f"${current_month_expenses:,.2f}")
+        self.card_labels['income'].configure(text=f"${current_month_income:,.2f}")
+        self.card_labels['balance'].configure(text=f"${balance:,.2f}", fg=balance_color)
+        self.card_labels['budget'].configure(
+            text=f"${budget_remaining:,.2f}" if budget > 0 else "No Budget Set"
+        )
         
     def _create_card(self, parent, title, value, color, row, col):
         """Create a summary card with enhanced modern styling"""
@@ -199,6 +198,8 @@ class DashboardTab:
         value_label.bind('<Enter>', on_enter)
         value_label.bind('<Leave>', on_leave)
         
+        return value_label
+        
     def _create_recent_transactions(self):
         """Show recent transactions with enhanced styling"""
         section_frame = tk.Frame(self.content_frame, bg=self.colors['bg'])
@@ -234,48 +235,69 @@ class DashboardTab:
         transactions_card.configure(highlightbackground=self.colors.get('border', '#e0e0e0'), 
                                    highlightthickness=1)
         
-        # Get recent transactions
-        recent = self.db_manager.get_recent_transactions(5)
+        # A fixed pool of rows, shown or hidden by _update_recent_transactions()
+        self.transaction_rows = [self._create_transaction_row(transactions_card)
+                                 for _ in range(self.RECENT_LIMIT)]
         
-        if recent:
-            for i, transaction in enumerate(recent):
-                self._create_transaction_row(transactions_card, transaction, i)
-        else:
-            # No transactions yet - improved empty state
-            empty_frame = tk.Frame(transactions_card, bg=self.colors['card'])
-            empty_frame.pack(expand=True, fill="both", pady=50)
-            
-            empty_icon = tk.Label(empty_frame,
-                                 text="📝",
-                                 bg=self.colors['card'],
-                                 font=('Segoe UI', 48))
-            empty_icon.pack(pady=(0, 15))
-            
-            no_data = tk.Label(empty_frame,
-                              text="No transactions yet",
-                              bg=self.colors['card'],
-                              fg=self.colors['primary'],
-                              font=('Segoe UI', 13, 'bold'))
-            no_data.pack(pady=(0, 5))
-            
-            sub_text = tk.Label(empty_frame,
-                               text="Start adding expenses to track your spending!",
-                               bg=self.colors['card'],
-                               fg=self.colors.get('text_secondary', self.colors['dark']),
-                               font=('Segoe UI', 10))
-            sub_text.pack()
+        # No transactions yet - improved empty state
+        self.empty_frame = tk.Frame(transactions_card, bg=self.colors['card'])
+        
+        empty_icon = tk.Label(self.empty_frame,
+                             text="📝",
+                             bg=self.colors['card'],
+                             font=('Segoe UI', 48))
+        empty_icon.pack(pady=(0, 15))
+        
+        no_data = tk.Label(self.empty_frame,
+                          text="No transactions yet",
+                          bg=self.colors['card'],
+                          fg=self.colors['primary'],
+                          font=('Segoe UI', 13, 'bold'))
+        no_data.pack(pady=(0, 5))
+        
+        sub_text = tk.Label(self.empty_frame,
+                           text="Start adding expenses to track your spending!",
+                           bg=self.colors['card'],
+                           fg=self.colors.get('text_secondary', self.colors['dark']),
+                           font=('Segoe UI', 10))
+        sub_text.pack()
+        self.shown_rows = None
+        
+    def _update_recent_transactions(self, recent):
+        """Show the given transactions in the row pool"""
+        # Repack only when the number of visible rows changes
+        if self.shown_rows != len(recent):
+            self.empty_frame.pack_forget()
+            for row in self.transaction_rows:
+                row['separator'].pack_forget()
+                row['row'].pack_forget()
+            for i, row in enumerate(self.transaction_rows[:len(recent)]):
+                if i > 0:
+                    row['separator'].pack(fill="x", padx=20, pady=0)
+                row['row'].pack(fill="x", padx=20, pady=8)
+            if not recent:
+                self.empty_frame.pack(expand=True, fill="both", pady=50)
+            self.shown_rows = len(recent)
+        
+        for row, transaction in zip(self.transaction_rows, recent):
+            is_expense = transaction['type'] == 'expense'
+            amount_prefix = "-" if is_expense else "+"
+            row['icon'].configure(text='💸' if is_expense else '💰')
+            row['description'].configure(text=transaction['description'])
+            row['detail'].configure(text=f"{transaction['date']}")
+            row['amount'].configure(
+                text=f"{amount_prefix}${transaction['amount']:,.2f}",
+                fg=self.colors['danger'] if is_expense else self.colors['success']
+            )
             
-    def _create_transaction_row(self, parent, transaction, index):
-        """Create a transaction row with hover effects"""
-        row = tk.Frame(parent, bg=self.colors['card'], cursor="hand2")
-        row.pack(fill="x", padx=20, pady=8)
+    def _create_transaction_row(self, parent):
+        """Create an unpacked transaction row with hover effects
         
-        # Add separator line except for first item
-        if index > 0:
-            separator = tk.Frame(parent, bg=self.colors.get('border', '#E1E8ED'), height=1)
-            separator.pack(fill="x", padx=20, pady=0)
-            separator.pack_forget()  # Pack before the row
-            separator.pack(fill="x", padx=20, pady=0, before=row)
+        Returns a dict of the widgets _update_recent_transactions() fills in.
+        """
+        # Separator line, shown above every row except the first
+        separator = tk.Frame(parent, bg=self.colors.get('border', '#E1E8ED'), height=1)
+        row = tk.Frame(parent, bg=self.colors['card'], cursor="hand2")
         
         # Icon/Category indicator with background
         icon_bg = tk.Frame(row, bg=self.colors.get('light', '#ECF0F1'), 
@@ -283,11 +305,8 @@ class DashboardTab:
         icon_bg.pack(side="left", padx=(0, 15))
         icon_bg.pack_propagate(False)
         
-        # Use transaction type icon
-        type_icon = '💸' if transaction['type'] == 'expense' else '💰'
-        
+        # Transaction type icon
         category_label = tk.Label(icon_bg,
-                                 text=type_icon,
                                  bg=self.colors.get('light', '#ECF0F1'),
                                  fg=self.colors['secondary'],
                                  font=('Segoe UI', 18))
@@ -299,7 +318,6 @@ class DashboardTab:
         
         # Description with better typography
         desc_label = tk.Label(info_frame,
-                             text=transaction['description'],
                              bg=self.colors['card'],
                              fg=self.colors.get('text_primary', self.colors['dark']),
                              font=('Segoe UI', 11, 'bold'),
@@ -307,9 +325,7 @@ class DashboardTab:
         desc_label.pack(fill="x")
         
         # Date only (removed category)
-        detail_text = f"{transaction['date']}"
         detail_label = tk.Label(info_frame,
-                               text=detail_text,
                                bg=self.colors['card'],
                                fg=self.colors.get('text_secondary', '#7f8c8d'),
                                font=('Segoe UI', 9),
@@ -317,16 +333,11 @@ class DashboardTab:
         detail_label.pack(fill="x")
         
         # Amount with enhanced styling
-        amount_color = self.colors['danger'] if transaction['type'] == 'expense' else self.colors['success']
-        amount_prefix = "-" if transaction['type'] == 'expense' else "+"
-        
         amount_frame = tk.Frame(row, bg=self.colors['card'])
         amount_frame.pack(side="right", padx=10)
         
         amount_label = tk.Label(amount_frame,
-                               text=f"{amount_prefix}${transaction['amount']:,.2f}",
                                bg=self.colors['card'],
-                               fg=amount_color,
                                font=('Segoe UI', 13, 'bold'))
         amount_label.pack()
         
@@ -351,6 +362,15 @@ class DashboardTab:
         for widget in [row, info_frame, desc_label, detail_label, amount_frame, amount_label]:
             widget.bind('<Enter>', on_enter)
             widget.bind('<Leave>', on_leave)
+            
+        return {
+            'separator': separator,
+            'row': row,
+            'icon': category_label,
+            'description': desc_label,
+            'detail': detail_label,
+            'amount': amount_label
+        }
         
     def _get_category_icon(self, category):
         """Get emoji icon for category"""
@@ -465,10 +485,16 @@ class DashboardTab:
             self.notebook.select(2)
     
     def refresh_data(self):
-        """Refresh dashboard data after adding new transactions"""
-        # Clear existing content
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-        
-        # Rebuild UI
-        self._build_dashboard()
+        """Update the cards and recent list in place from one data snapshot"""
+        # The snapshot may have to load the file, fetch it off the Tk thread
+        self.io_executor.submit(self.db_manager.get_dashboard_snapshot, self.RECENT_LIMIT,
+                                on_done=self._apply_snapshot)
+        
+    def _apply_snapshot(self, snapshot):
+        """Show a dashboard snapshot fetched by refresh_data()"""
+        self._update_summary_cards(snapshot)
+        self._update_recent_transactions(snapshot['recent'])
+        
+    def on_data_changed(self, event):
+        """Update the dashboard for a data change event"""
+        self.refresh_data()
@@ -4,17 +4,33 @@ Expenses Tab - Add and manage expenses
 import tkinter as tk
 from tkinter import ttk, messagebox
 from datetime import datetime
-from tkcalendar import DateEntry
+import numpy as np
+import pandas as pd
+from utils.events import TRANSACTIONS_DELETED
+from gui.virtual_list import VirtualTreeview
+
+
+def _date_entry_class():
+    """Import tkcalendar's DateEntry on first use, it is slow to import"""
+    from tkcalendar import DateEntry
+    return DateEntry
+
 
 class ExpensesTab:
     """Expenses management tab"""
     
-    def __init__(self, parent, config_manager, db_manager, colors, dashboard_tab=None, analytics_tab=None):
+    # Wait this long after the last keystroke before filtering
+    SEARCH_DELAY_MS = 150
+    
+    def __init__(self, parent, config_manager, db_manager, colors, io_executor):
         self.config_manager = config_manager
         self.db_manager = db_manager
         self.colors = colors
-        self.dashboard_tab = dashboard_tab
-        self.analytics_tab = analytics_tab
+        self.io_executor = io_executor
+        
+        # The loaded date range, searched in memory while typing
+        self.range_df = None
+        self._search_job = None
         
         # Create main frame
         self.frame = tk.Frame(parent, bg=colors['bg'])
@@ -142,6 +158,7 @@ class ExpensesTab:
                 anchor='w').pack(side="left")
         
         try:
+            DateEntry = _date_entry_class()
             self.date_entry = DateEntry(date_frame,
                                        width=18,
                                        background=self.colors['secondary'],
@@ -185,17 +202,17 @@ class ExpensesTab:
         buttons_frame = tk.Frame(fields_frame, bg=self.colors['bg'])
         buttons_frame.pack(fill="x", pady=(15, 0))
         
-        save_btn = tk.Button(buttons_frame,
-                            text="Save",
-                            bg=self.colors['success'],
-                            fg=self.colors['white'],
-                            font=('Segoe UI', 9, 'bold'),
-                            relief="flat",
-                            cursor="hand2",
-                            command=self._save_expense,
-                            padx=20,
-                            pady=6)
-        save_btn.pack(side="left", padx=(0, 8))
+        self.save_btn = tk.Button(buttons_frame,
+                                 text="Save",
+                                 bg=self.colors['success'],
+                                 fg=self.colors['white'],
+                                 font=('Segoe UI', 9, 'bold'),
+                                 relief="flat",
+                                 cursor="hand2",
+                                 command=self._save_expense,
+                                 padx=20,
+                                 pady=6)
+        self.save_btn.pack(side="left", padx=(0, 8))
         
         clear_btn = tk.Button(buttons_frame,
                              text="Clear",
@@ -316,10 +333,10 @@ class ExpensesTab:
         self.expense_tree = ttk.Treeview(tree_frame,
                                         columns=columns,
                                         show='headings',
-                                        yscrollcommand=scrollbar.set,
                                         height=15)
         
-        scrollbar.config(command=self.expense_tree.yview)
+        # Large ranges only materialize the rows around the view
+        self.expense_rows = VirtualTreeview(self.expense_tree, scrollbar)
         
         # Configure columns
         self.expense_tree.heading('Date', text='Date')
@@ -342,17 +359,17 @@ class ExpensesTab:
         action_frame = tk.Frame(list_card, bg=self.colors['bg'])
         action_frame.pack(fill="x", pady=(10, 0))
         
-        delete_btn = tk.Button(action_frame,
-                              text="🗑️ Delete Selected",
-                              bg=self.colors['danger'],
-                              fg=self.colors['white'],
-                              font=('Segoe UI', 9, 'bold'),
-                              relief="flat",
-                              cursor="hand2",
-                              command=self._delete_expense,
-                              padx=15,
-                              pady=6)
-        delete_btn.pack(side="left", padx=(0, 8))
+        self.delete_btn = tk.Button(action_frame,
+                                   text="🗑️ Delete Selected",
+                                   bg=self.colors['danger'],
+                                   fg=self.colors['white'],
+                                   font=('Segoe UI', 9, 'bold'),
+                                   relief="flat",
+                                   cursor="hand2",
+                                   command=self._delete_expense,
+                                   padx=15,
+                                   pady=6)
+        self.delete_btn.pack(side="left", padx=(0, 8))
         
         refresh_btn = tk.Button(action_frame,
                                text="🔄 Refresh",
@@ -392,30 +409,33 @@ class ExpensesTab:
                 messagebox.showwarning("Validation Error", "Amount must be greater than 0")
                 return
             
-            # Save to database - no category
-            self.db_manager.add_transaction(
+            # Save to database on the I/O thread - no category
+            self.save_btn.config(state="disabled", text="Saving...")
+            self.io_executor.submit(
+                self.db_manager.add_transaction,
                 date=date,
                 description=description if description else "No description",
                 category='General',  # Default category
                 amount=amount,
                 transaction_type=transaction_type,
-                notes=notes
+                notes=notes,
+                on_done=self._on_expense_saved,
+                on_error=self._on_expense_save_failed
             )
             
-            messagebox.showinfo("Success", "Transaction saved successfully!")
-            self._clear_form()
-            self._load_expenses()
-            
-            # Refresh other tabs
-            if self.dashboard_tab:
-                self.dashboard_tab.refresh_data()
-            if self.analytics_tab:
-                self.analytics_tab._refresh_analytics()
-            
         except ValueError:
             messagebox.showerror("Error", "Please enter a valid amount")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save transaction: {str(e)}")
+            
+    def _on_expense_saved(self, transaction_id):
+        """Confirm a saved transaction; the list updates from the change event"""
+        self.save_btn.config(state="normal", text="Save")
+        messagebox.showinfo("Success", "Transaction saved successfully!")
+        self._clear_form()
+        
+    def _on_expense_save_failed(self, error):
+        """Report a transaction that could not be saved"""
+        self.save_btn.config(state="normal", text="Save")
+        messagebox.showerror("Error", f"Failed to save transaction: {str(error)}")
             
     def _clear_form(self):
         """Clear form fields"""
@@ -433,9 +453,32 @@ class ExpensesTab:
         """Load expenses into treeview with current date filter"""
         self._apply_date_filter()
             
+    def refresh_data(self):
+        """Reload the list after the data changed while the tab was hidden"""
+        self._load_expenses()
+        
+    def on_data_changed(self, event):
+        """Update the list for a data change event"""
+        if event.kind == TRANSACTIONS_DELETED:
+            # Deleted rows only need to leave the list, the rest stays in place
+            if self.range_df is not None:
+                self.range_df = self.range_df[~self.range_df['id'].isin(event.ids)]
+                self._populate_tree(keep_position=True)
+        else:
+            # New rows may fall anywhere in the date-sorted, filtered list
+            self._load_expenses()
+            
     def _filter_expenses(self, *args):
-        """Filter expenses based on search and current date filter"""
-        self._apply_date_filter()
+        """Filter the loaded expenses by the search text once typing pauses"""
+        if self._search_job is not None:
+            self.frame.after_cancel(self._search_job)
+        self._search_job = self.frame.after(self.SEARCH_DELAY_MS, self._apply_search)
+        
+    def _apply_search(self):
+        """Show the loaded expenses matching the search text"""
+        self._search_job = None
+        if self.range_df is not None:
+            self._populate_tree()
                 
     def _delete_expense(self):
         """Delete selected expense"""
@@ -445,19 +488,22 @@ class ExpensesTab:
             return
         
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this transaction?"):
-            for item in selected:
-                # The iid is the transaction ID
-                transaction_id = item
-                self.db_manager.delete_transaction(transaction_id)
-            
-            self._load_expenses()
+            # The iids are the transaction IDs, delete them in one batch;
+            # the list and the other tabs update from the change event
+            self.delete_btn.config(state="disabled")
+            self.io_executor.submit(self.db_manager.delete_transactions, list(selected),
+                                    on_done=self._on_expense_deleted,
+                                    on_error=self._on_expense_delete_failed)
             
-            # Refresh other tabs
-            if self.dashboard_tab:
-                self.dashboard_tab.refresh_data()
-            if self.analytics_tab:
-                self.analytics_tab._refresh_analytics()
-            messagebox.showinfo("Success", "Transaction deleted successfully!")
+    def _on_expense_deleted(self, result):
+        """Confirm a finished delete"""
+        self.delete_btn.config(state="normal")
+        messagebox.showinfo("Success", "Transaction deleted successfully!")
+        
+    def _on_expense_delete_failed(self, error):
+        """Report a delete that could not be completed"""
+        self.delete_btn.config(state="normal")
+        messagebox.showerror("Error", f"Failed to delete transaction: {str(error)}")
     
     def _apply_date_filter(self):
         """Apply the selected date filter"""
@@ -508,6 +554,7 @@ class ExpensesTab:
         # From date
         tk.Label(dialog, text="From Date:", font=('Segoe UI', 10)).pack(pady=(20, 5))
         try:
+            DateEntry = _date_entry_class()
             from_date = DateEntry(dialog, width=20, font=('Segoe UI', 10), date_pattern='yyyy-mm-dd')
             from_date.pack(pady=5)
         except:
@@ -518,6 +565,7 @@ class ExpensesTab:
         # To date
         tk.Label(dialog, text="To Date:", font=('Segoe UI', 10)).pack(pady=(10, 5))
         try:
+            DateEntry = _date_entry_class()
             to_date = DateEntry(dialog, width=20, font=('Segoe UI', 10), date_pattern='yyyy-mm-dd')
             to_date.pack(pady=5)
         except:
@@ -545,38 +593,60 @@ class ExpensesTab:
     
     def _load_filtered_expenses(self, start_date, end_date):
         """Load expenses filtered by date range"""
-        from datetime import datetime
-        
-        # Clear existing items
-        for item in self.expense_tree.get_children():
-            self.expense_tree.delete(item)
-        
-        # Load from database
-        expenses = self.db_manager.get_all_transactions()
-        
-        # Apply search filter if any
+        # Load the date range from the database on the I/O thread
+        self.frame.config(cursor="watch")
+        self.io_executor.submit(self._load_range, start_date, end_date,
+                                on_done=self._show_expenses,
+                                on_error=self._on_expenses_load_failed)
+        
+    def _load_range(self, start_date, end_date):
+        """Load a date range with a lowercased description column to search (I/O thread)"""
+        columns = self.db_manager.get_transactions_between(start_date, end_date, as_columns=True)
+        expenses = pd.DataFrame({
+            'id': columns['id'],
+            'date': np.datetime_as_string(columns['date']),
+            'description': columns['description'],
+            'amount': columns['amount'],
+            'type': columns['type']
+        })
+        expenses['search'] = expenses['description'].astype(str).str.lower()
+        return expenses
+        
+    def _on_expenses_load_failed(self, error):
+        """Report a failed list load and keep the current list"""
+        self.frame.config(cursor="")
+        print(f"Error loading transactions: {error}")
+        
+    def _show_expenses(self, expenses):
+        """Show a loaded date range, filtered by the current search text"""
+        self.frame.config(cursor="")
+        self.range_df = expenses
+        self._populate_tree()
+        
+    def _populate_tree(self, keep_position=False):
+        """Show the loaded expenses matching the search text"""
+        expenses = self.range_df
+        
+        # Apply search filter if any, vectorized over the lowercased column
         search_term = self.search_var.get().lower()
+        if search_term:
+            expenses = expenses[expenses['search'].str.contains(search_term, regex=False)]
+        
+        # Rows are formatted only when the list materializes them
+        ids = expenses['id'].tolist()
+        dates = expenses['date'].tolist()
+        descriptions = expenses['description'].tolist()
+        amounts = expenses['amount'].tolist()
+        types = expenses['type'].tolist()
+        
+        def make_row(index):
+            trans_type = types[index]
+            values = (
+                dates[index],
+                descriptions[index],
+                f"${amounts[index]:.2f}",
+                trans_type.capitalize()
+            )
+            return ids[index], values, (trans_type,)
         
-        for expense in expenses:
-            # Parse expense date
-            try:
-                expense_date = datetime.strptime(expense['date'], '%Y-%m-%d').date()
-            except:
-                continue
-            
-            # Check if within date range
-            if start_date <= expense_date <= end_date:
-                # Check search filter
-                if search_term and search_term not in expense['description'].lower():
-                    continue
-                
-                trans_type = expense['type']
-                self.expense_tree.insert('', 'end',
-                                       iid=expense['id'],
-                                       values=(
-                                           expense['date'],
-                                           expense['description'],
-                                           f"${expense['amount']:.2f}",
-                                           trans_type.capitalize()
-                                       ),
-                                       tags=(trans_type,))
+        self.expense_rows.set_rows(len(ids), make_row, keep_position)
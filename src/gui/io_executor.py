@@ -0,0 +1,92 @@
+"""
+I/O Executor - Runs database work off the Tk thread
+"""
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+
+class IOExecutor:
+    """Runs blocking calls on a worker thread and delivers results on the Tk thread
+
+    A single worker keeps database operations in submission order. Results,
+    errors and forwarded events go through a queue that the Tk main loop
+    drains with root.after, since widgets may only be touched from there.
+    """
+
+    # How often the Tk thread checks for finished work
+    POLL_INTERVAL_MS = 30
+
+    def __init__(self, root):
+        self.root = root
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='budget-io')
+        self._results = queue.Queue()
+        self._pending = 0
+        self._busy_listeners = []
+        self._closed = False
+        self._poll()
+
+    def submit(self, func, *args, on_done=None, on_error=None, **kwargs):
+        """Run func(*args, **kwargs) on the worker thread
+
+        on_done(result) or on_error(exception) is then called on the Tk
+        thread. Errors without an on_error handler are printed.
+        """
+        self._set_pending(self._pending + 1)
+
+        def run():
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._results.put((self._finish, (on_error, e, True)))
+            else:
+                self._results.put((self._finish, (on_done, result, False)))
+
+        return self._executor.submit(run)
+
+    def call_soon(self, callback, *args):
+        """Call callback(*args) on the Tk thread; safe to use from any thread"""
+        self._results.put((callback, args))
+
+    def add_busy_listener(self, callback):
+        """Call callback(busy) whenever work starts or all work has finished"""
+        self._busy_listeners.append(callback)
+
+    def is_busy(self):
+        """Check whether any submitted work has not been delivered yet"""
+        return self._pending > 0
+
+    def shutdown(self):
+        """Wait for running work to finish and stop polling"""
+        self._closed = True
+        self._executor.shutdown(wait=True)
+
+    def _finish(self, callback, value, failed):
+        """Deliver one finished call's result or error"""
+        self._set_pending(self._pending - 1)
+        if callback is not None:
+            callback(value)
+        elif failed:
+            print(f"Error in background task: {value}")
+
+    def _set_pending(self, count):
+        """Track outstanding work and notify listeners when busy state flips"""
+        was_busy = self._pending > 0
+        self._pending = count
+        if was_busy != (count > 0):
+            for listener in self._busy_listeners:
+                listener(count > 0)
+
+    def _poll(self):
+        """Run queued callbacks on the Tk thread, then poll again"""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error delivering background result: {e}")
+
+        if not self._closed:
+            self.root.after(self.POLL_INTERVAL_MS, self._poll)
@@ -5,17 +5,50 @@ Modern, minimalistic interface with tabbed navigation
 import tkinter as tk
 from tkinter import ttk
 from gui.dashboard import DashboardTab
-from gui.expenses import ExpensesTab
-from gui.analytics import AnalyticsTab
-from gui.settings import SettingsTab
+
+
+def _noop(*args, **kwargs):
+    """Stand-in for methods of a tab that has not been built yet"""
+
+
+class LazyTab:
+    """Notebook page whose tab object is only constructed when first shown
+    
+    Attribute access is forwarded to the built tab. Before it exists,
+    calls such as refresh_data() are no-ops: the tab reads fresh data
+    when it is eventually built anyway.
+    """
+    
+    def __init__(self, notebook, factory, bg):
+        self.frame = tk.Frame(notebook, bg=bg)
+        self.tab = None
+        self._factory = factory
+        
+    def build(self):
+        """Construct the tab inside the placeholder frame if not done yet"""
+        if self.tab is None:
+            self.tab = self._factory(self.frame)
+            self.tab.frame.pack(fill="both", expand=True)
+        return self.tab
+        
+    def __getattr__(self, name):
+        tab = self.__dict__.get('tab')
+        if tab is None:
+            return _noop
+        return getattr(tab, name)
+
 
 class MainWindow:
     """Main application window with tabbed interface"""
     
-    def __init__(self, root, config_manager, db_manager):
+    def __init__(self, root, config_manager, db_manager, io_executor):
         self.root = root
         self.config_manager = config_manager
         self.db_manager = db_manager
+        self.io_executor = io_executor
+        
+        # Writes run on the I/O thread, deliver their events on the Tk thread
+        self.db_manager.events.set_dispatcher(self.io_executor.call_soon)
         
         # Configure modern theme
         self._setup_theme()
@@ -29,6 +62,7 @@ class MainWindow:
         
         # Create status bar
         self._create_status_bar()
+        self.io_executor.add_busy_listener(self._on_busy_changed)
         
     def _setup_theme(self):
         """Configure modern theme colors and styles"""
@@ -126,11 +160,14 @@ class MainWindow:
         self.notebook = ttk.Notebook(notebook_frame)
         self.notebook.pack(fill="both", expand=True)
         
-        # Create tabs
-        self.dashboard_tab = DashboardTab(self.notebook, self.config_manager, self.db_manager, self.colors, self.notebook)
-        self.analytics_tab = AnalyticsTab(self.notebook, self.config_manager, self.db_manager, self.colors)
-        self.expenses_tab = ExpensesTab(self.notebook, self.config_manager, self.db_manager, self.colors, self.dashboard_tab, self.analytics_tab)
-        self.settings_tab = SettingsTab(self.notebook, self.config_manager, self.db_manager, self.colors)
+        # Create tabs - only the Dashboard is built up front, the others
+        # are constructed the first time they are selected
+        self.dashboard_tab = DashboardTab(self.notebook, self.config_manager, self.db_manager, self.colors,
+                                          self.io_executor, self.notebook)
+        self.analytics_tab = LazyTab(self.notebook, self._create_analytics_tab, self.colors['bg'])
+        self.expenses_tab = LazyTab(self.notebook, self._create_expenses_tab, self.colors['bg'])
+        self.settings_tab = LazyTab(self.notebook, self._create_settings_tab, self.colors['bg'])
+        self.lazy_tabs = [self.analytics_tab, self.expenses_tab, self.settings_tab]
         
         # Add tabs to notebook
         self.notebook.add(self.dashboard_tab.frame, text="📊 Dashboard")
@@ -138,6 +175,55 @@ class MainWindow:
         self.notebook.add(self.analytics_tab.frame, text="📈 Analytics")
         self.notebook.add(self.settings_tab.frame, text="⚙️ Settings")
         
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
+        # Tabs hidden when data changed, refreshed once they are shown
+        self.dirty_tabs = set()
+        self.db_manager.events.subscribe(self._on_data_changed)
+        
+    def _on_tab_changed(self, event=None):
+        """Build a lazy tab the first time it is selected, refresh it if stale"""
+        selected = self.notebook.select()
+        for tab in self.lazy_tabs:
+            if str(tab.frame) == selected:
+                if tab.tab is None:
+                    # A freshly built tab reads current data anyway
+                    tab.build()
+                    self.dirty_tabs.discard(tab)
+        for tab in list(self.dirty_tabs):
+            if str(tab.frame) == selected:
+                self.dirty_tabs.discard(tab)
+                tab.refresh_data()
+                
+    def _on_data_changed(self, event):
+        """Update the visible tab in place and mark the hidden ones dirty"""
+        selected = self.notebook.select()
+        for tab in [self.dashboard_tab] + self.lazy_tabs:
+            if isinstance(tab, LazyTab) and tab.tab is None:
+                continue
+            if str(tab.frame) == selected:
+                tab.on_data_changed(event)
+            else:
+                self.dirty_tabs.add(tab)
+                
+    def _create_analytics_tab(self, parent):
+        """Create the Analytics tab (imports the predictor on first use)"""
+        from gui.analytics import AnalyticsTab
+        return AnalyticsTab(parent, self.config_manager, self.db_manager, self.colors,
+                            self.io_executor)
+        
+    def _create_expenses_tab(self, parent):
+        """Create the Expenses tab"""
+        from gui.expenses import ExpensesTab
+        return ExpensesTab(parent, self.config_manager, self.db_manager, self.colors,
+                           self.io_executor)
+        
+    def _create_settings_tab(self, parent):
+        """Create the Settings tab"""
+        from gui.settings import SettingsTab
+        return SettingsTab(parent, self.config_manager, self.db_manager, self.colors,
+                           self.io_executor)
+        
     def _create_status_bar(self):
         """Create enhanced status bar at bottom"""
         status_bar = tk.Frame(self.main_container, bg=self.colors['primary'], height=28)
@@ -177,3 +263,8 @@ class MainWindow:
                                  fg=self.colors['light'],
                                  font=('Segoe UI', 9))
         data_indicator.pack(side="right", padx=(10, 5))
+        
+    def _on_busy_changed(self, busy):
+        """Show a busy cursor and status while database work is running"""
+        self.status_label.config(text="● Working..." if busy else "● Ready")
+        self.root.config(cursor="watch" if busy else "")
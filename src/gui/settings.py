@@ -4,14 +4,18 @@ Settings Tab - Application settings and configuration
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+from utils.importers import FILE_TYPES
 
 class SettingsTab:
     """Settings and configuration tab"""
     
-    def __init__(self, parent, config_manager, db_manager, colors):
+    def __init__(self, parent, config_manager, db_manager, colors, io_executor):
         self.config_manager = config_manager
         self.db_manager = db_manager
         self.colors = colors
+        self.io_executor = io_executor
+        # Last validation report fetched for the malformed rows warning
+        self.validation_report = None
         
         # Create main frame
         self.frame = tk.Frame(parent, bg=colors['bg'])
@@ -167,38 +171,59 @@ class SettingsTab:
                                anchor='w')
         export_label.pack(fill="x", pady=(0, 10))
         
-        export_btn = tk.Button(data_frame,
-                              text="📤 Export to Excel",
-                              bg=self.colors['success'],
-                              fg=self.colors['white'],
-                              font=('Segoe UI', 10, 'bold'),
-                              relief="flat",
-                              cursor="hand2",
-                              command=self._export_data,
-                              padx=20,
-                              pady=10)
-        export_btn.pack(anchor='w', pady=(0, 20))
+        self.export_btn = tk.Button(data_frame,
+                                   text="📤 Export to Excel",
+                                   bg=self.colors['success'],
+                                   fg=self.colors['white'],
+                                   font=('Segoe UI', 10, 'bold'),
+                                   relief="flat",
+                                   cursor="hand2",
+                                   command=self._export_data,
+                                   padx=20,
+                                   pady=10)
+        self.export_btn.pack(anchor='w', pady=(0, 20))
+        
+        # Export report
+        report_label = tk.Label(data_frame,
+                               text="Export a report with monthly, daily and forecast summaries:",
+                               bg=self.colors['card'],
+                               fg=self.colors['dark'],
+                               font=('Segoe UI', 11),
+                               anchor='w')
+        report_label.pack(fill="x", pady=(0, 10))
+        
+        self.report_btn = tk.Button(data_frame,
+                                   text="📊 Export Report",
+                                   bg=self.colors['success'],
+                                   fg=self.colors['white'],
+                                   font=('Segoe UI', 10, 'bold'),
+                                   relief="flat",
+                                   cursor="hand2",
+                                   command=self._export_report,
+                                   padx=20,
+                                   pady=10)
+        self.report_btn.pack(anchor='w', pady=(0, 20))
         
         # Import data
         import_label = tk.Label(data_frame,
-                               text="Import data from Excel:",
+                               text="Import data from Excel, CSV, OFX or QIF:",
                                bg=self.colors['card'],
                                fg=self.colors['dark'],
                                font=('Segoe UI', 11),
                                anchor='w')
         import_label.pack(fill="x", pady=(0, 10))
         
-        import_btn = tk.Button(data_frame,
-                              text="📥 Import from Excel",
-                              bg=self.colors['secondary'],
-                              fg=self.colors['white'],
-                              font=('Segoe UI', 10, 'bold'),
-                              relief="flat",
-                              cursor="hand2",
-                              command=self._import_data,
-                              padx=20,
-                              pady=10)
-        import_btn.pack(anchor='w', pady=(0, 20))
+        self.import_btn = tk.Button(data_frame,
+                                   text="📥 Import Data",
+                                   bg=self.colors['secondary'],
+                                   fg=self.colors['white'],
+                                   font=('Segoe UI', 10, 'bold'),
+                                   relief="flat",
+                                   cursor="hand2",
+                                   command=self._import_data,
+                                   padx=20,
+                                   pady=10)
+        self.import_btn.pack(anchor='w', pady=(0, 20))
         
         # Data location
         location_label = tk.Label(data_frame,
@@ -232,6 +257,39 @@ class SettingsTab:
                                     pady=10)
         open_folder_btn.pack(anchor='w', pady=(10, 0))
         
+        # Malformed rows found while loading the data file
+        self.validation_warning = tk.Label(data_frame,
+                                           bg=self.colors['card'],
+                                           fg=self.colors['danger'],
+                                           font=('Segoe UI', 9),
+                                           anchor='w',
+                                           cursor="hand2")
+        self.validation_warning.bind("<Button-1>", lambda e: self._show_validation_report())
+        self._update_validation_warning()
+        
+    def _update_validation_warning(self):
+        """Fetch the validation report off the Tk thread, then update the warning"""
+        self.io_executor.submit(self.db_manager.get_validation_report,
+                                on_done=self._show_validation_warning)
+        
+    def _show_validation_warning(self, report):
+        """Show the malformed rows warning only while there are any"""
+        self.validation_report = report
+        if report['invalid_rows']:
+            self.validation_warning.config(text=f"⚠️ {report['invalid_rows']} malformed rows are excluded "
+                                                f"from your data (click for details)")
+            self.validation_warning.pack(fill="x", pady=(10, 0))
+        else:
+            self.validation_warning.pack_forget()
+            
+    def refresh_data(self):
+        """Update data-dependent widgets after the data changed while hidden"""
+        self._update_validation_warning()
+        
+    def on_data_changed(self, event):
+        """Update data-dependent widgets for a data change event"""
+        self._update_validation_warning()
+        
     def _create_about_section(self, parent):
         """Create about section"""
         section_frame = tk.Frame(parent, bg=self.colors['bg'])
@@ -310,27 +368,94 @@ class SettingsTab:
         )
         
         if filename:
-            try:
-                self.db_manager.export_to_excel(filename)
-                messagebox.showinfo("Success", f"Data exported successfully to:\n{filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export data:\n{str(e)}")
+            self.export_btn.config(state="disabled", text="⏳ Exporting...")
+            self.io_executor.submit(self.db_manager.export_to_excel, filename,
+                                    on_done=lambda result: self._on_export_done(filename),
+                                    on_error=self._on_export_failed)
+                
+    def _on_export_done(self, filename):
+        """Confirm a finished export"""
+        self.export_btn.config(state="normal", text="📤 Export to Excel")
+        messagebox.showinfo("Success", f"Data exported successfully to:\n{filename}")
+        
+    def _on_export_failed(self, error):
+        """Report a failed export"""
+        self.export_btn.config(state="normal", text="📤 Export to Excel")
+        messagebox.showerror("Error", f"Failed to export data:\n{str(error)}")
+                
+    def _export_report(self):
+        """Export a report workbook with summary sheets"""
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            title="Export Report"
+        )
+        
+        if filename:
+            self.report_btn.config(state="disabled", text="⏳ Exporting...")
+            self.io_executor.submit(self.db_manager.export_report, filename,
+                                    on_done=lambda result: self._on_report_done(filename),
+                                    on_error=self._on_report_failed)
+                
+    def _on_report_done(self, filename):
+        """Confirm a finished report export"""
+        self.report_btn.config(state="normal", text="📊 Export Report")
+        messagebox.showinfo("Success", f"Report exported successfully to:\n{filename}")
+        
+    def _on_report_failed(self, error):
+        """Report a failed report export"""
+        self.report_btn.config(state="normal", text="📊 Export Report")
+        messagebox.showerror("Error", f"Failed to export report:\n{str(error)}")
                 
     def _import_data(self):
-        """Import data from Excel"""
-        filename = filedialog.askopenfilename(
-            filetypes=[("Excel files", "*.xlsx *.xls"), ("All files", "*.*")],
+        """Import data from Excel, CSV or bank statement files"""
+        filenames = filedialog.askopenfilenames(
+            filetypes=FILE_TYPES,
             title="Import Data"
         )
         
-        if filename:
+        if filenames:
             if messagebox.askyesno("Confirm Import", 
-                                  "This will add data from the file. Continue?"):
-                try:
-                    self.db_manager.import_from_excel(filename)
-                    messagebox.showinfo("Success", "Data imported successfully!")
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to import data:\n{str(e)}")
+                                  f"This will add data from {len(filenames)} file(s). Continue?"):
+                self.import_btn.config(state="disabled", text="⏳ Importing...")
+                self.io_executor.submit(self.db_manager.import_files, list(filenames),
+                                        on_done=self._on_import_done,
+                                        on_error=self._on_import_failed)
+                
+    def _on_import_done(self, report):
+        """Confirm a finished import with what it added and left out"""
+        self.import_btn.config(state="normal", text="📥 Import Data")
+        lines = [f"Added: {report['added']} transactions",
+                 f"Skipped (already stored): {report['skipped']}"]
+        if report['conflicting']:
+            ids = ', '.join(str(transaction_id) for transaction_id in report['conflicts'][:5])
+            if report['conflicting'] > 5:
+                ids += ", ..."
+            lines.append(f"Conflicting (id already used by another transaction): "
+                         f"{report['conflicting']} ({ids})")
+        if report['invalid']:
+            lines.append(f"Malformed rows left out: {report['invalid']}")
+            lines += [f"  {problem['file']} row {problem['row']}: {', '.join(problem['problems'])}"
+                      for problem in report['problems'][:5]]
+            if report['invalid'] > 5:
+                lines.append(f"  ... and {report['invalid'] - 5} more")
+        messagebox.showinfo("Import Complete", "\n".join(lines))
+        
+    def _on_import_failed(self, error):
+        """Report a failed import"""
+        self.import_btn.config(state="normal", text="📥 Import Data")
+        messagebox.showerror("Error", f"Failed to import data:\n{str(error)}")
+                    
+    def _show_validation_report(self):
+        """Show the malformed rows found in the data file"""
+        report = self.validation_report
+        lines = [f"Row {problem['row']} (id {problem['id']}): {', '.join(problem['problems'])}"
+                 for problem in report['problems'][:20]]
+        if len(report['problems']) > 20:
+            lines.append(f"... and {len(report['problems']) - 20} more")
+        messagebox.showwarning("Malformed Rows",
+                               "These rows could not be read and are left out of all "
+                               "totals and lists:\n\n" + "\n".join(lines))
                     
     def _open_data_folder(self):
         """Open data folder in file explorer"""
@@ -0,0 +1,148 @@
+"""
+Virtual List - Treeview rendering for large row sets
+"""
+
+
+class VirtualTreeview:
+    """Shows any number of rows in a ttk.Treeview without creating them all
+
+    Up to VIRTUAL_THRESHOLD rows are inserted in full, in chunks spread
+    across after() callbacks so the window keeps painting. Above that only
+    a window of WINDOW_ROWS rows around the visible ones exists in the
+    tree. The scrollbar is mapped onto the full row set and the window is
+    refilled whenever scrolling gets close to its edges.
+    """
+
+    VIRTUAL_THRESHOLD = 2000
+    CHUNK_SIZE = 500
+
+    # Rows materialized in virtual mode, and how close to the window's
+    # edge the view may get before the window is moved
+    WINDOW_ROWS = 200
+    EDGE_ROWS = 50
+
+    def __init__(self, tree, scrollbar):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.count = 0
+        self.virtual = False
+        self.window_start = 0
+        self.window_end = 0
+        self._make_row = None
+        self._chunk_job = None
+        self._refill_job = None
+
+        tree.configure(yscrollcommand=self._on_tree_scroll)
+        scrollbar.configure(command=self._on_scrollbar)
+
+    def set_rows(self, count, make_row, keep_position=False):
+        """Show count rows, where make_row(i) returns (iid, values, tags) for row i"""
+        first = self._first_row() if keep_position else 0
+        self._cancel_jobs()
+
+        self.count = count
+        self.virtual = count > self.VIRTUAL_THRESHOLD
+        self._make_row = make_row
+
+        # One delete call instead of one per item
+        self.tree.delete(*self.tree.get_children())
+        if self.virtual:
+            self._fill(first)
+        else:
+            self.window_start, self.window_end = 0, count
+            self._insert_chunk(0, first)
+
+    def _insert_chunk(self, start, first):
+        """Insert the next chunk of rows and schedule the one after it"""
+        end = min(self.count, start + self.CHUNK_SIZE)
+        self._insert(start, end)
+        if end < self.count:
+            self._chunk_job = self.tree.after(1, self._insert_chunk, end, first)
+        else:
+            self._chunk_job = None
+            if first and self.count:
+                self.tree.yview_moveto(first / self.count)
+
+    def _insert(self, start, end):
+        """Insert rows start..end-1 at the end of the tree"""
+        for index in range(start, end):
+            iid, values, tags = self._make_row(index)
+            self.tree.insert('', 'end', iid=iid, values=values, tags=tags)
+
+    def _fill(self, first):
+        """Materialize a window of rows with row `first` at the top of the view"""
+        self._refill_job = None
+        if not self.count:
+            self.window_start = self.window_end = 0
+            return
+
+        first = max(0, min(int(first), self.count - 1))
+        start = max(0, first - self.EDGE_ROWS)
+        end = min(self.count, start + self.WINDOW_ROWS)
+        start = max(0, end - self.WINDOW_ROWS)
+
+        # Keep whatever part of the selection is still in the window
+        selected = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        self.window_start, self.window_end = start, end
+        self._insert(start, end)
+        kept = [iid for iid in selected if self.tree.exists(iid)]
+        if kept:
+            self.tree.selection_set(kept)
+
+        self.tree.yview_moveto((first - start) / (end - start))
+
+    def _first_row(self):
+        """Get the index of the row at the top of the view"""
+        size = self.window_end - self.window_start
+        if not size:
+            return 0
+        return self.window_start + int(round(self.tree.yview()[0] * size))
+
+    def _on_tree_scroll(self, first, last):
+        """Map the tree's view of its window onto the scrollbar for all rows"""
+        first, last = float(first), float(last)
+        if not self.virtual:
+            self.scrollbar.set(first, last)
+            return
+
+        size = self.window_end - self.window_start
+        top = self.window_start + first * size
+        bottom = self.window_start + last * size
+        self.scrollbar.set(top / self.count, bottom / self.count)
+
+        near_start = top - self.window_start < self.EDGE_ROWS // 2 and self.window_start > 0
+        near_end = self.window_end - bottom < self.EDGE_ROWS // 2 and self.window_end < self.count
+        if (near_start or near_end) and self._refill_job is None:
+            # Not from inside the tree's own scroll callback
+            self._refill_job = self.tree.after_idle(self._fill, int(top))
+
+    def _on_scrollbar(self, *args):
+        """Scroll to a position among all rows, refilling the window if needed"""
+        if not self.virtual:
+            self.tree.yview(*args)
+            return
+
+        size = self.window_end - self.window_start
+        view_first, view_last = self.tree.yview()
+        visible = max(1, int((view_last - view_first) * size))
+
+        if args[0] == 'moveto':
+            first = float(args[1]) * self.count
+        else:
+            step = visible if args[2].startswith('page') else 1
+            first = self._first_row() + int(args[1]) * step
+        first = int(max(0, min(first, self.count - visible)))
+
+        if self.window_start <= first and first + visible <= self.window_end:
+            self.tree.yview_moveto((first - self.window_start) / size)
+        else:
+            self._fill(first)
+
+    def _cancel_jobs(self):
+        """Stop pending chunk inserts and window refills"""
+        for job in (self._chunk_job, self._refill_job):
+            if job is not None:
+                self.tree.after_cancel(job)
+        self._chunk_job = None
+        self._refill_job = None
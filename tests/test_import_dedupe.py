@@ -0,0 +1,99 @@
+"""
+Tests for duplicate-free imports through DatabaseManager.import_files()
+"""
+import os
+import pandas as pd
+from utils.database_manager import DatabaseManager
+
+STATEMENT = pd.DataFrame({
+    'date': ['2024-01-05', '2024-01-05', '2024-01-06', '2024-01-07'],
+    'description': ['Coffee', 'Coffee', 'Salary', 'Broken'],
+    'category': ['Food', 'Food', 'Salary', 'Other'],
+    'amount': ['3.50', '3.50', '1000', 'not a number'],
+    'type': ['expense', 'expense', 'income', 'expense']
+})
+
+
+def _manager(tmp_path):
+    DatabaseManager._cache.clear()
+    return DatabaseManager('excel', data_dir=str(tmp_path / 'data'))
+
+
+def test_reimporting_a_csv_adds_nothing(tmp_path):
+    statement = tmp_path / 'statement.csv'
+    STATEMENT.to_csv(statement, index=False)
+    db = _manager(tmp_path)
+
+    first = db.import_files([str(statement)])
+    assert (first['added'], first['skipped'], first['invalid']) == (3, 0, 1)
+    assert first['problems'][0]['file'] == 'statement.csv'
+    assert first['problems'][0]['row'] == 4
+
+    second = db.import_files([str(statement)])
+    assert (second['added'], second['skipped'], second['invalid']) == (0, 3, 1)
+
+    report = db.get_validation_report()
+    assert (report['valid_rows'], report['invalid_rows']) == (3, 0)
+
+
+def test_reimporting_an_excel_file_adds_nothing(tmp_path):
+    statement = tmp_path / 'statement.xlsx'
+    STATEMENT.to_excel(statement, index=False)
+    db = _manager(tmp_path)
+
+    db.import_files([str(statement)])
+    # A new manager must reload the persisted content index
+    db = _manager(tmp_path)
+    report = db.import_files([str(statement)])
+    assert (report['added'], report['skipped']) == (0, 3)
+    assert db.get_validation_report()['valid_rows'] == 3
+
+
+def test_repeated_rows_match_stored_copies_one_to_one(tmp_path):
+    statement = tmp_path / 'statement.csv'
+    STATEMENT.iloc[:1].to_csv(statement, index=False)
+    db = _manager(tmp_path)
+    db.import_files([str(statement)])
+
+    # Two identical purchases when only one is stored: the second is new
+    both = tmp_path / 'both.csv'
+    STATEMENT.iloc[:2].to_csv(both, index=False)
+    report = db.import_files([str(both)])
+    assert (report['added'], report['skipped']) == (1, 1)
+
+
+def test_stored_id_with_other_contents_is_a_conflict(tmp_path):
+    db = _manager(tmp_path)
+    db.add_transaction('2024-01-05', 'Rent', 'Bills', 500, 'expense')
+    stored_id = db.get_transactions_frame()['id'].iloc[0]
+
+    statement = tmp_path / 'statement.csv'
+    STATEMENT.iloc[:1].assign(id=stored_id).to_csv(statement, index=False)
+    report = db.import_files([str(statement)])
+    assert (report['added'], report['conflicting']) == (0, 1)
+    assert report['conflicts'] == [stored_id]
+
+
+def test_backends_keep_separate_content_indexes(tmp_path):
+    excel = _manager(tmp_path)
+    sqlite = DatabaseManager('sqlite', data_dir=str(tmp_path / 'data'))
+    assert excel.content_index.path != sqlite.content_index.path
+
+
+def test_single_adds_update_the_index_in_memory_only(tmp_path):
+    statement = tmp_path / 'statement.csv'
+    STATEMENT.iloc[:1].to_csv(statement, index=False)
+    db = _manager(tmp_path)
+    db.import_files([str(statement)])
+    saved_at = os.stat(db.content_index.path).st_mtime_ns
+
+    db.add_transaction('2024-01-09', 'Lunch', 'Food', 12, 'expense')
+    assert os.stat(db.content_index.path).st_mtime_ns == saved_at
+
+    lunch = tmp_path / 'lunch.csv'
+    pd.DataFrame({'date': ['2024-01-09'], 'description': ['Lunch'], 'category': ['Food'],
+                  'amount': ['12'], 'type': ['expense']}).to_csv(lunch, index=False)
+    assert db.import_files([str(lunch)])['skipped'] == 1
+    # The stale file is rebuilt rather than trusted by a new process
+    db = _manager(tmp_path)
+    assert db.import_files([str(lunch)])['skipped'] == 1
@@ -0,0 +1,36 @@
+"""
+Tests for keeping the cached ledger sorted by date across writes
+"""
+import numpy as np
+from utils.database_manager import DatabaseManager
+
+
+def _row(date, description, category='Food'):
+    return {'date': date, 'description': description, 'category': category,
+            'amount': 1.0, 'type': 'expense'}
+
+
+def test_writes_keep_the_cache_sorted_without_resorting(tmp_path):
+    DatabaseManager._cache.clear()
+    db = DatabaseManager('sqlite', data_dir=str(tmp_path / 'data'))
+    db.add_transactions([_row('2024-03-01', 'c'), _row('2024-01-01', 'a')])
+    db.add_transactions([_row('2024-02-01', 'b', 'Travel'), _row('2024-03-01', 'd'),
+                         _row('2023-12-31', 'z')])
+    ids = db.add_transactions([_row('2024-01-01', 'a2')])
+    db.delete_transactions([ids[0]])
+    db.add_transactions([_row('2024-01-01', 'a3')])
+
+    entry = db._get_cache_entry()
+    df = entry['df']
+    # Same-day rows stay in the order they were added, as a stable sort keeps them
+    assert df['description'].tolist() == ['z', 'a', 'a3', 'b', 'c', 'd']
+    assert np.array_equal(entry['days'],
+                          df['date'].to_numpy().astype('datetime64[D]').astype(np.int64))
+    assert df['category'].dtype == 'category'
+    assert set(df['category'].astype(str)) == {'Food', 'Travel'}
+
+    # A reload from storage gives the same ledger
+    DatabaseManager._cache.clear()
+    reloaded = db._get_cache_entry()['df']
+    assert sorted(reloaded['description']) == sorted(df['description'])
+    assert reloaded['date'].is_monotonic_increasing
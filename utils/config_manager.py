@@ -36,7 +36,8 @@ class ConfigManager:
             'currency': 'USD',
             'currency_symbol': '$',
             'date_format': '%Y-%m-%d',
-            'theme': 'light'
+            'theme': 'light',
+            'storage_backend': 'excel'
         }
         
         # Load from file if exists
@@ -108,3 +109,7 @@ class ConfigManager:
     def get_date_format(self):
         """Get date format"""
         return self.config.get('date_format', '%Y-%m-%d')
+        
+    def get_storage_backend(self):
+        """Get transaction storage backend name ('excel' or 'sqlite')"""
+        return self.config.get('storage_backend', 'excel')
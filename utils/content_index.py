@@ -0,0 +1,66 @@
+"""
+Content Index
+Persisted hashes of transaction contents for duplicate detection on import
+"""
+import os
+from collections import Counter
+import numpy as np
+import pandas as pd
+
+# The fields that make two transactions the same, whatever their ids
+CONTENT_COLUMNS = ('date', 'amount', 'description', 'type')
+
+
+def content_hashes(df):
+    """Hash the content columns of typed transaction rows into a uint64 array
+
+    Descriptions are compared without surrounding whitespace and case, and
+    amounts to the cent, so a statement exported twice hashes the same.
+    """
+    key = pd.DataFrame({
+        'date': df['date'].dt.strftime('%Y-%m-%d').astype(object),
+        'amount': df['amount'].astype('float64').round(2),
+        'description': df['description'].astype(str).str.strip().str.lower().astype(object),
+        'type': df['type'].astype(str).astype(object)
+    }, columns=list(CONTENT_COLUMNS))
+    return pd.util.hash_pandas_object(key, index=False).to_numpy(dtype=np.uint64)
+
+
+class ContentIndex:
+    """Stores a multiset of content hashes next to the transactions file
+
+    The hashes are saved with the signature of the data they were built
+    from, so a stale index is detected and rebuilt instead of trusted.
+    Held in memory as a Counter, since identical transactions on the same
+    day are legitimate and each stored copy matches one imported copy.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self, signature):
+        """Load the hash counts if they were stored for this data signature"""
+        if signature is None or not os.path.exists(self.path):
+            return None
+        try:
+            with np.load(self.path) as data:
+                if data['source'].tolist() != list(signature):
+                    return None
+                return Counter(data['hashes'].tolist())
+        except Exception as e:
+            print(f"Ignoring unreadable content index: {e}")
+            return None
+
+    def store(self, counts, signature):
+        """Write the hash counts for the given data signature"""
+        if signature is None:
+            return False
+        hashes = np.fromiter(counts.elements(), dtype=np.uint64)
+        temp_path = self.path + '.tmp.npz'
+        try:
+            np.savez(temp_path, hashes=hashes, source=np.array(signature, dtype=np.int64))
+            os.replace(temp_path, self.path)
+            return True
+        except Exception as e:
+            print(f"Could not write content index: {e}")
+            return False
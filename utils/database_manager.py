@@ -1,18 +1,54 @@
 """
 Database Manager
-Manages data storage using Excel spreadsheets
+Manages transaction storage through a pluggable backend (Excel or SQLite)
 """
 import os
+import threading
+import multiprocessing
+import numpy as np
 import pandas as pd
 from datetime import datetime
-import uuid
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from utils.storage import (ExcelStorage, TRANSACTION_COLUMNS, create_backend,
+                           empty_transactions_frame)
+from utils.schema import (CATEGORICAL_COLUMNS, categorize, normalize_transactions,
+                          to_storage_frame)
+from utils.results import TransactionColumns
+from utils.importers import get_importer, read_statement
+from utils.excel_io import write_excel, write_excel_sheets
+from utils.reports import build_report_sheets
+from utils.content_index import ContentIndex, content_hashes
+from utils.events import (EventBus, DataChangeEvent, TRANSACTIONS_ADDED,
+                          TRANSACTIONS_DELETED, TRANSACTIONS_IMPORTED)
 
 class DatabaseManager:
-    """Manages data persistence using Excel files"""
+    """Manages data persistence using a configurable storage backend"""
     
-    def __init__(self):
-        self.data_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
-        self.transactions_file = os.path.join(self.data_dir, 'transactions.xlsx')
+    # Process-wide cache of parsed transaction files, keyed by file path.
+    # Each entry holds the backend signature (mtime, size) it was read at.
+    _cache = {}
+    _cache_lock = threading.Lock()
+    
+    # Serializes writes and file reloads, which may run on a worker thread
+    # while the UI thread reads from the cache
+    _io_lock = threading.RLock()
+    _cache_hits = 0
+    _cache_misses = 0
+    
+    def __init__(self, storage_backend='excel', data_dir=None):
+        self.data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data')
+        self.backend = create_backend(storage_backend, self.data_dir)
+        self.transactions_file = self.backend.path
+        
+        # Hashes of stored contents, so imports can skip rows already present,
+        # one file per backend since each is built from that backend's data
+        self.content_index = ContentIndex(
+            os.path.join(self.data_dir, f'transactions.{self.backend.name}.index.npz')
+        )
+        
+        # Subscribers are notified after every successful write
+        self.events = EventBus()
         
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
@@ -22,230 +58,762 @@ class DatabaseManager:
         
     def _initialize_database(self):
         """Initialize database file if it doesn't exist"""
-        if not os.path.exists(self.transactions_file):
-            # Create empty DataFrame with schema
-            df = pd.DataFrame(columns=[
-                'id',
-                'date',
-                'description',
-                'category',
-                'amount',
-                'type',
-                'notes',
-                'created_at'
-            ])
-            df.to_excel(self.transactions_file, index=False, engine='openpyxl')
+        if self.backend.exists():
+            return
+        
+        # Carry existing spreadsheet data over when switching to another backend
+        seed = None
+        legacy = ExcelStorage(self.data_dir)
+        if legacy.path != self.backend.path and legacy.exists():
+            try:
+                seed = legacy.load()
+            except Exception as e:
+                print(f"Error migrating transactions: {e}")
+        
+        self.backend.initialize(seed)
+        
+    def _get_cache_entry(self):
+        """Get the cache entry for the current file, loading it on a miss
+        
+        An entry is a dict with the 'signature' it was read at, the typed
+        transactions 'df' sorted by date, their int64 day numbers in 'days'
+        for binary search, the malformed rows kept aside in 'invalid' with
+        their 'problems', and the lazily built 'monthly' rollup and
+        'hashes' content index.
+        """
+        cls = DatabaseManager
+        signature = self.backend.signature()
+        
+        with cls._cache_lock:
+            entry = cls._cache.get(self.transactions_file)
+            if entry is not None and signature is not None and entry['signature'] == signature:
+                cls._cache_hits += 1
+                return entry
+            cls._cache_misses += 1
+        
+        with cls._io_lock:
+            # A write that just finished may have cached the new data already
+            signature = self.backend.signature()
+            with cls._cache_lock:
+                entry = cls._cache.get(self.transactions_file)
+                if entry is not None and signature is not None and entry['signature'] == signature:
+                    return entry
             
-    def _load_transactions(self):
-        """Load transactions from Excel file"""
-        try:
-            df = pd.read_excel(self.transactions_file, engine='openpyxl')
-            return df
-        except Exception as e:
-            print(f"Error loading transactions: {e}")
-            return pd.DataFrame(columns=[
-                'id', 'date', 'description', 'category', 
-                'amount', 'type', 'notes', 'created_at'
-            ])
+            try:
+                raw = self.backend.load()
+            except Exception as e:
+                print(f"Error loading transactions: {e}")
+                raw = empty_transactions_frame()
+                signature = None
             
-    def _save_transactions(self, df):
-        """Save transactions to Excel file"""
+            # Parse and type every column once here instead of in each query
+            df, invalid, problems = normalize_transactions(raw)
+            if problems:
+                print(f"Found {len(problems)} malformed transaction rows, "
+                      f"see DatabaseManager.get_validation_report()")
+            
+            entry = _make_cache_entry(signature, df, invalid, problems)
+            self._store_cache_entry(entry)
+            return entry
+        
+    def _load_transactions(self):
+        """Load the typed transactions, reusing the cache when the file is unchanged"""
+        # Callers modify the frame they get back, so hand out a copy
+        return self._get_cache_entry()['df'].copy()
+        
+    def _get_monthly_rollup(self, entry=None):
+        """Get the (year, month, type) -> sum/count/min/max rollup"""
+        entry = entry or self._get_cache_entry()
+        monthly = entry['monthly']
+        if monthly is None:
+            # Build outside the lock, keeping whichever rollup was stored first
+            monthly = _build_monthly_rollup(entry['df'])
+            with DatabaseManager._cache_lock:
+                if entry['monthly'] is None:
+                    entry['monthly'] = monthly
+                monthly = entry['monthly']
+        return monthly
+        
+    def _get_content_counts(self, entry=None):
+        """Get the content hash -> row count index of the typed transactions"""
+        entry = entry or self._get_cache_entry()
+        counts = entry['hashes']
+        if counts is None:
+            # Load or hash outside the lock, keeping whichever index was stored first
+            counts = self.content_index.load(entry['signature'])
+            if counts is None:
+                counts = Counter(content_hashes(entry['df']).tolist())
+            with DatabaseManager._cache_lock:
+                if entry['hashes'] is None:
+                    entry['hashes'] = counts
+                counts = entry['hashes']
+        return counts
+        
+    def _save_content_index(self):
+        """Persist the in-memory content index for the current data, if built"""
+        entry = self._get_cache_entry()
+        if entry['hashes'] is not None:
+            self.content_index.store(entry['hashes'], entry['signature'])
+        
+    def _store_cache_entry(self, entry):
+        """Store a cache entry, or drop the cached file when it has no signature"""
+        cls = DatabaseManager
+        with cls._cache_lock:
+            if entry is None or entry['signature'] is None:
+                cls._cache.pop(self.transactions_file, None)
+            else:
+                cls._cache[self.transactions_file] = entry
+                
+    def _commit(self, df, write, added=None, removed=None, invalid=None, problems=None,
+                days=None):
+        """Run a backend write, then cache df as the resulting typed ledger
+        
+        added/removed are the typed rows that changed. When given, the
+        monthly rollup is updated incrementally instead of being rebuilt.
+        invalid/problems replace the malformed rows kept aside, which are
+        otherwise carried over from the current cache entry. days are the
+        day numbers of df when it is already sorted by date, as from
+        _merge_sorted(); otherwise df is sorted here.
+        """
+        with DatabaseManager._cache_lock:
+            previous = DatabaseManager._cache.get(self.transactions_file)
+        
         try:
-            df.to_excel(self.transactions_file, index=False, engine='openpyxl')
+            write()
         except Exception as e:
             print(f"Error saving transactions: {e}")
+            # The file may be partially written, force a reload next time
+            self._store_cache_entry(None)
             raise
+        
+        # The manager wrote this data itself, so no need to parse it back
+        monthly = None
+        hashes = None
+        with DatabaseManager._cache_lock:
+            changed = previous is not None and (added is not None or removed is not None)
+            if changed and previous['monthly'] is not None:
+                # Update a copy, readers on other threads may hold the old one
+                monthly = {key: dict(stats) for key, stats in previous['monthly'].items()}
+                _update_monthly_rollup(monthly, df, added, removed)
+            if changed and previous['hashes'] is not None:
+                # Updated in place: only writers, which hold _io_lock, use it.
+                # It is saved by import_files(), not on every write
+                hashes = previous['hashes']
+                if added is not None:
+                    hashes.update(content_hashes(added).tolist())
+                if removed is not None:
+                    for key in content_hashes(removed).tolist():
+                        hashes[key] -= 1
+                        # Drop hashes with no rows left
+                        if hashes[key] <= 0:
+                            del hashes[key]
+        
+        if invalid is None:
+            invalid = previous['invalid'] if previous is not None else empty_transactions_frame()
+            problems = previous['problems'] if previous is not None else []
+        
+        self._store_cache_entry(
+            _make_cache_entry(self.backend.signature(), df, invalid, problems, monthly, hashes,
+                              days)
+        )
+        
+    def _storage_frame(self, df):
+        """Build the full storage frame: typed rows plus the malformed rows kept aside"""
+        out = to_storage_frame(df)
+        invalid = self._get_cache_entry()['invalid']
+        if invalid.empty:
+            return out
+        return pd.concat([out, invalid.reindex(columns=TRANSACTION_COLUMNS)],
+                         ignore_index=True)
+        
+    def _insert_rows(self, rows, existing_df):
+        """Write new storage rows, rewriting everything for very large batches"""
+        limit = self.backend.bulk_insert_limit
+        if limit is not None and len(rows) > limit:
+            full = pd.concat([self._storage_frame(existing_df), rows], ignore_index=True)
+            self.backend.save(full)
+        else:
+            self.backend.insert(rows)
+            
+    def _save_transactions(self, df):
+        """Replace all stored transactions"""
+        with DatabaseManager._io_lock:
+            full = self._storage_frame(df)
+            self._commit(df, lambda: self.backend.save(full))
+        
+    def compact(self):
+        """Fold pending journal entries into the main storage file"""
+        with DatabaseManager._io_lock:
+            if not self.backend.needs_compaction():
+                return False
+            self._save_transactions(self._load_transactions())
+            return True
+        
+    def get_cache_stats(self):
+        """Get process-wide transaction cache hit/miss counters"""
+        cls = DatabaseManager
+        with cls._cache_lock:
+            return {'hits': cls._cache_hits, 'misses': cls._cache_misses}
+            
+    def reset_cache_stats(self):
+        """Reset the transaction cache hit/miss counters"""
+        cls = DatabaseManager
+        with cls._cache_lock:
+            cls._cache_hits = 0
+            cls._cache_misses = 0
+            
+    def invalidate_cache(self):
+        """Drop the cached transactions so the next read parses the file again"""
+        self._store_cache_entry(None)
+        
+    def get_data_version(self):
+        """Get a value that changes whenever the stored transactions change"""
+        return self._get_cache_entry()['signature']
+        
+    def get_validation_report(self):
+        """Get the malformed rows found when the transactions were loaded
+        
+        Returns a dict with 'valid_rows', 'invalid_rows' and 'problems',
+        a list of {'row', 'id', 'problems'} dicts. Malformed rows are kept
+        in storage untouched but left out of every query.
+        """
+        entry = self._get_cache_entry()
+        return {
+            'valid_rows': len(entry['df']),
+            'invalid_rows': len(entry['invalid']),
+            'problems': list(entry['problems'])
+        }
             
     def add_transaction(self, date, description, category, amount, 
                        transaction_type='expense', notes=''):
         """Add a new transaction"""
-        df = self._load_transactions()
-        
-        # Create new transaction
-        new_transaction = {
-            'id': str(uuid.uuid4()),
+        return self.add_transactions([{
             'date': date,
             'description': description,
             'category': category,
-            'amount': float(amount),
+            'amount': amount,
             'type': transaction_type,
-            'notes': notes,
-            'created_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+            'notes': notes
+        }])[0]
+        
+    def add_transactions(self, rows):
+        """Add several transactions with one load and one save
+        
+        rows is a list of dicts with 'date', 'description', 'category',
+        'amount' and optionally 'type' and 'notes'. Returns the new ids.
+        """
+        with DatabaseManager._io_lock:
+            if not rows:
+                return []
+            
+            entry = self._get_cache_entry()
+            
+            # Fill generated columns for the whole batch at once
+            new_df = pd.DataFrame(rows).reindex(columns=TRANSACTION_COLUMNS)
+            new_df['id'] = _new_ids(len(new_df))
+            new_df['amount'] = new_df['amount'].astype(float)
+            new_df['type'] = new_df['type'].fillna('expense')
+            new_df['notes'] = new_df['notes'].fillna('')
+            new_df['created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            
+            new_df, invalid, problems = normalize_transactions(new_df)
+            if problems:
+                raise ValueError(f"Invalid transaction: {'; '.join(problems[0]['problems'])}")
+            
+            # Insert the rows at their dates, the ledger stays sorted
+            existing_df = entry['df']
+            df, days = _merge_sorted(existing_df, entry['days'], new_df)
+            
+            # Save
+            rows_out = to_storage_frame(new_df)
+            self._commit(df, lambda: self._insert_rows(rows_out, existing_df), added=new_df,
+                         days=days)
+            
+            ids = new_df['id'].tolist()
+            self.events.publish(DataChangeEvent(TRANSACTIONS_ADDED, ids))
+            return ids
         
-        # Append to DataFrame using pd.concat
-        new_df = pd.DataFrame([new_transaction])
-        df = pd.concat([df, new_df], ignore_index=True)
+    def get_all_transactions(self, as_columns=False):
+        """Get all transactions, newest first
         
-        # Save
-        self._save_transactions(df)
-        return new_transaction['id']
+        Returns a list of dicts, or a TransactionColumns if as_columns is set.
+        """
+        df = self._get_cache_entry()['df']
         
-    def get_all_transactions(self):
-        """Get all transactions"""
-        df = self._load_transactions()
+        # The cached frame is sorted by date, newest first is just reversed
+        return _to_result(df.iloc[::-1], as_columns)
         
-        if df.empty:
-            return []
+    def get_transactions_frame(self):
+        """Get all transactions as a typed DataFrame
         
-        # Sort by date descending
-        df = df.sort_values('date', ascending=False)
+        Dates are datetime64, amounts float64 and 'type'/'category' are
+        categoricals. The frame is a copy and may be modified freely.
+        """
+        return self._load_transactions()
         
-        # Convert to list of dictionaries
-        transactions = df.to_dict('records')
-        return transactions
+    def get_recent_transactions(self, limit=10, as_columns=False):
+        """Get the newest transactions, newest first"""
+        df = self._get_cache_entry()['df']
         
-    def get_recent_transactions(self, limit=10):
-        """Get recent transactions"""
-        df = self._load_transactions()
+        # The newest rows are the tail of the date-sorted frame
+        recent = df.iloc[-limit:][::-1] if limit > 0 else df.iloc[:0]
+        return _to_result(recent, as_columns)
         
-        if df.empty:
-            return []
+    def get_dashboard_snapshot(self, limit=5):
+        """Get everything the dashboard shows from a single cache read
         
-        # Sort by date descending and limit
-        df = df.sort_values('date', ascending=False).head(limit)
+        Returns a dict with the current month's 'expenses' and 'income'
+        totals and the 'recent' transactions, newest first.
+        """
+        entry = self._get_cache_entry()
+        monthly = self._get_monthly_rollup(entry)
+        today = datetime.now()
         
-        return df.to_dict('records')
+        totals = {}
+        for transaction_type in ('expense', 'income'):
+            stats = monthly.get((today.year, today.month, transaction_type))
+            totals[transaction_type] = stats['sum'] if stats else 0.0
         
-    def delete_transaction(self, transaction_id):
-        """Delete a transaction"""
-        df = self._load_transactions()
+        recent = entry['df'].iloc[-limit:][::-1] if limit > 0 else entry['df'].iloc[:0]
+        return {
+            'expenses': totals['expense'],
+            'income': totals['income'],
+            'recent': _to_records(recent)
+        }
         
-        # Remove transaction
-        df = df[df['id'] != transaction_id]
+    def get_transactions_between(self, start_date, end_date, as_columns=False):
+        """Get transactions dated within [start_date, end_date], newest first"""
+        df = _date_slice(self._get_cache_entry(), start_date, end_date)
+        return _to_result(df.iloc[::-1], as_columns)
         
-        # Save
-        self._save_transactions(df)
+    def delete_transaction(self, transaction_id):
+        """Delete a transaction"""
+        self.delete_transactions([transaction_id])
+        
+    def delete_transactions(self, transaction_ids):
+        """Delete several transactions with one load and one save"""
+        with DatabaseManager._io_lock:
+            transaction_ids = [str(transaction_id) for transaction_id in transaction_ids]
+            if not transaction_ids:
+                return
+            
+            entry = self._get_cache_entry()
+            df = entry['df']
+            
+            # Remove transactions; what is left is still sorted by date
+            mask = df['id'].astype(str).isin(transaction_ids).to_numpy()
+            removed = df[mask]
+            df = df[~mask].reset_index(drop=True)
+            
+            # Save
+            self._commit(df, lambda: self.backend.delete(transaction_ids), removed=removed,
+                         days=entry['days'][~mask])
+            self.events.publish(DataChangeEvent(TRANSACTIONS_DELETED, removed['id'].tolist()))
         
     def get_current_month_total(self):
         """Get total expenses for current month"""
-        df = self._load_transactions()
-        
-        if df.empty:
-            return 0.0
-        
-        # Convert date column to datetime
-        df['date'] = pd.to_datetime(df['date'])
-        
-        # Filter current month expenses
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        
-        month_df = df[(df['date'].dt.month == current_month) & 
-                     (df['date'].dt.year == current_year) &
-                     (df['type'] == 'expense')]
-        
-        if month_df.empty:
-            return 0.0
-        
-        return float(month_df['amount'].sum())
+        today = datetime.now()
+        return self.get_month_total(today.year, today.month)
         
     def get_current_month_income(self):
         """Get total income for current month"""
-        df = self._load_transactions()
-        
-        if df.empty:
-            return 0.0
-        
-        df['date'] = pd.to_datetime(df['date'])
-        
-        current_month = datetime.now().month
-        current_year = datetime.now().year
-        
-        month_df = df[(df['date'].dt.month == current_month) & 
-                     (df['date'].dt.year == current_year) &
-                     (df['type'] == 'income')]
-        
-        if month_df.empty:
-            return 0.0
-        
-        return float(month_df['amount'].sum())
-        
-    def get_month_total(self, year, month):
-        """Get total expenses for a specific month"""
-        df = self._load_transactions()
-        
-        if df.empty:
-            return 0.0
-        
-        df['date'] = pd.to_datetime(df['date'])
-        
-        month_df = df[(df['date'].dt.month == month) & 
-                     (df['date'].dt.year == year) &
-                     (df['type'] == 'expense')]
-        
-        if month_df.empty:
-            return 0.0
-        
-        return float(month_df['amount'].sum())
+        today = datetime.now()
+        return self.get_month_total(today.year, today.month, 'income')
         
-    def get_filtered_transactions(self, period):
-        """Get transactions filtered by period"""
-        df = self._load_transactions()
+    def get_month_total(self, year, month, transaction_type='expense'):
+        """Get total expenses (or income) for a specific month"""
+        return self.get_month_summary(year, month, transaction_type)['sum']
         
-        if df.empty:
-            return []
+    def get_month_summary(self, year, month, transaction_type='expense'):
+        """Get sum, count, min and max of a month's transactions of one type"""
+        stats = self._get_monthly_rollup().get((year, month, transaction_type))
+        if stats is None:
+            return {'sum': 0.0, 'count': 0, 'min': 0.0, 'max': 0.0}
+        return dict(stats)
         
-        df['date'] = pd.to_datetime(df['date'])
-        today = datetime.now()
+    def get_filtered_transactions(self, period, as_columns=False):
+        """Get transactions filtered by period, oldest first"""
+        today = pd.Timestamp(datetime.now()).normalize()
+        end_date = None
         
         if period == "This Week":
-            start_date = today - pd.Timedelta(days=7)
+            start_date = today - pd.Timedelta(days=6)
         elif period == "This Month":
             start_date = today.replace(day=1)
         elif period == "Last Month":
-            last_month = today.replace(day=1) - pd.Timedelta(days=1)
-            start_date = last_month.replace(day=1)
             end_date = today.replace(day=1) - pd.Timedelta(days=1)
-            df = df[(df['date'] >= start_date) & (df['date'] <= end_date)]
-            return df.to_dict('records')
+            start_date = end_date.replace(day=1)
         elif period == "Last 3 Months":
-            start_date = today - pd.Timedelta(days=90)
+            start_date = today - pd.Timedelta(days=89)
         elif period == "This Year":
             start_date = today.replace(month=1, day=1)
         elif period == "All Time":
-            return df.to_dict('records')
+            start_date = None
         else:
             start_date = today.replace(day=1)
         
-        df = df[df['date'] >= start_date]
-        return df.to_dict('records')
+        df = _date_slice(self._get_cache_entry(), start_date, end_date)
+        return _to_result(df, as_columns)
         
-    def export_to_excel(self, filename):
-        """Export data to Excel file"""
-        df = self._load_transactions()
-        df.to_excel(filename, index=False, engine='openpyxl')
+    def export_to_excel(self, filename, start_date=None, end_date=None, transaction_type=None):
+        """Export data to Excel file
+        
+        Only transactions dated within [start_date, end_date] and of the
+        given type are written when those are set. Malformed rows are
+        part of an unfiltered export only. Rows are streamed to the file,
+        so memory stays bounded by the frame being exported.
+        """
+        entry = self._get_cache_entry()
+        df = _date_slice(entry, start_date, end_date)
+        if transaction_type:
+            df = df[(df['type'] == transaction_type).to_numpy()]
+        
+        if start_date is None and end_date is None and not transaction_type:
+            df = self._storage_frame(df)
+        else:
+            df = to_storage_frame(df)
+        write_excel(df, filename)
+        
+    def export_report(self, filename):
+        """Export a report workbook: the raw ledger plus summary sheets
+        
+        The monthly rollup, daily running balance and trend come from one
+        per-day aggregation of the cached transactions, which the projection
+        also reuses for its month totals. Its regression forecast still
+        fits on the full ledger in a pass of its own. See utils.reports.
+        """
+        # The predictor module is only needed here, keep it off the import path
+        from utils.predictor import FinancialPredictor
+        
+        entry = self._get_cache_entry()
+        sheets = build_report_sheets(self._storage_frame(entry['df']), entry['df'],
+                                     FinancialPredictor(self))
+        write_excel_sheets(sheets, filename)
         
     def import_from_excel(self, filename):
-        """Import data from Excel file"""
-        try:
-            import_df = pd.read_excel(filename, engine='openpyxl')
-            
-            # Validate columns
-            required_columns = ['date', 'description', 'category', 'amount', 'type']
-            if not all(col in import_df.columns for col in required_columns):
-                raise ValueError("Invalid file format. Missing required columns.")
-            
-            # Load existing transactions
-            existing_df = self._load_transactions()
-            
-            # Add IDs and timestamps to imported data
-            for idx in import_df.index:
-                if 'id' not in import_df.columns or pd.isna(import_df.at[idx, 'id']):
-                    import_df.at[idx, 'id'] = str(uuid.uuid4())
-                if 'created_at' not in import_df.columns or pd.isna(import_df.at[idx, 'created_at']):
-                    import_df.at[idx, 'created_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                if 'notes' not in import_df.columns:
-                    import_df.at[idx, 'notes'] = ''
-            
-            # Combine and save
-            combined_df = pd.concat([existing_df, import_df], ignore_index=True)
-            self._save_transactions(combined_df)
-            
-        except Exception as e:
-            print(f"Error importing data: {e}")
-            raise
-            
+        """Import data from Excel file, see import_files()"""
+        return self.import_files([filename])
+        
+    def import_files(self, filenames):
+        """Import transactions from Excel, CSV, OFX or QIF files
+        
+        A single file is streamed in chunks, so memory stays bounded by
+        the chunk size plus the typed rows being imported. Several files
+        are parsed concurrently in a process pool and merged into one
+        bulk insert; each worker sends back its whole file, so that path
+        holds every file's raw rows in memory at once.
+        
+        Rows whose date, amount, description and type match a stored
+        transaction are skipped, so importing the same file twice adds
+        nothing. Rows reusing a stored id with different contents are
+        left out as conflicting. Malformed rows are left out and
+        reported, not stored.
+        
+        Returns a report dict with the 'added', 'skipped', 'conflicting'
+        and 'invalid' row counts, the ids of the 'conflicts' and the
+        'problems' of the malformed rows as {'file', 'row', 'id',
+        'problems'} dicts, with rows counted within each file.
+        """
+        # Fail on unsupported files before parsing any of them
+        readers = [get_importer(filename) for filename in filenames]
+        if len(filenames) > 1:
+            # Parsed before taking the lock, reading files doesn't touch the ledger
+            workers = min(len(filenames), os.cpu_count() or 1)
+            # Forking a threaded Tk process can deadlock, start fresh interpreters
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as pool:
+                chunks = [(filename, chunk)
+                          for filename, statement in zip(filenames,
+                                                         pool.map(read_statement, filenames))
+                          for chunk in statement]
+        else:
+            chunks = ((filenames[0], chunk) for chunk in readers[0](filenames[0]))
+        
+        with DatabaseManager._io_lock:
+            try:
+                # One timestamp for the whole import
+                created_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                imported, import_problems = [], []
+                rows_read = {}
+                
+                for filename, chunk in chunks:
+                    # Validate columns
+                    required_columns = ['date', 'description', 'category', 'amount', 'type']
+                    if not all(col in chunk.columns for col in required_columns):
+                        raise ValueError("Invalid file format. Missing required columns.")
+                    
+                    # Add IDs and timestamps to imported data, column by column
+                    chunk = _fill_import_defaults(chunk, created_at)
+                    
+                    # Malformed rows are only reported, storing them would
+                    # add them again on every import of the same file
+                    typed, invalid, problems = normalize_transactions(chunk)
+                    offset = rows_read.get(filename, 0)
+                    for problem in problems:
+                        problem['row'] += offset
+                        problem['file'] = os.path.basename(filename)
+                    rows_read[filename] = offset + len(chunk)
+                    
+                    imported.append(typed)
+                    import_problems.extend(problems)
+                
+                # Load existing transactions
+                entry = self._get_cache_entry()
+                existing_df = entry['df']
+                import_df = pd.concat(imported, ignore_index=True)
+                
+                known_ids = set(existing_df['id'])
+                known_ids.update(entry['invalid']['id'].dropna().astype(str))
+                
+                keep, skipped, conflicts = _match_imported(
+                    import_df, self._get_content_counts(entry), known_ids
+                )
+                import_df = categorize(import_df[keep].reset_index(drop=True))
+                report = {
+                    'added': len(import_df),
+                    'skipped': skipped,
+                    'conflicting': len(conflicts),
+                    'invalid': len(import_problems),
+                    'conflicts': conflicts,
+                    'problems': import_problems
+                }
+                if import_df.empty:
+                    self._save_content_index()
+                    return report
+                
+                # Combine and save
+                combined_df, days = _merge_sorted(existing_df, entry['days'], import_df)
+                rows_out = to_storage_frame(import_df)
+                self._commit(combined_df,
+                             lambda: self._insert_rows(rows_out, existing_df),
+                             added=import_df, days=days)
+                # Saved once per import, single adds and deletes only update it in memory
+                self._save_content_index()
+                self.events.publish(DataChangeEvent(TRANSACTIONS_IMPORTED, import_df['id'].tolist()))
+                return report
+                
+            except Exception as e:
+                print(f"Error importing data: {e}")
+                raise
+        
     def get_data_path(self):
         """Get the path to the data file"""
         return self.transactions_file
+
+
+def _new_ids(count):
+    """Generate count random (version 4) UUID strings from one batch of random bytes"""
+    raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    digits = raw.tobytes().hex()
+    return [
+        f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-{digits[i + 12:i + 16]}-"
+        f"{digits[i + 16:i + 20]}-{digits[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+def _fill_import_defaults(chunk, created_at):
+    """Fill missing ids, creation times and notes of imported rows in bulk"""
+    chunk = chunk.copy()
+    
+    if 'id' in chunk.columns:
+        ids = chunk['id'].astype(object)
+    else:
+        ids = pd.Series(None, index=chunk.index, dtype=object)
+    missing = ids.isna().to_numpy()
+    if missing.any():
+        ids[missing] = _new_ids(int(missing.sum()))
+    chunk['id'] = ids
+    
+    if 'created_at' in chunk.columns:
+        chunk['created_at'] = chunk['created_at'].astype(object).fillna(created_at)
+    else:
+        chunk['created_at'] = created_at
+    
+    if 'notes' not in chunk.columns:
+        chunk['notes'] = ''
+    return chunk
+
+
+def _match_imported(import_df, counts, known_ids):
+    """Pick the imported rows that are new to the ledger
+    
+    Each stored row absorbs at most one identical imported row, so a
+    statement with two equal purchases still adds the second one when
+    only the first was stored. Returns (keep_mask, skipped, conflict_ids).
+    """
+    keep = np.zeros(len(import_df), dtype=bool)
+    matched = Counter()
+    skipped = 0
+    conflicts = []
+    seen_ids = set(known_ids)
+    
+    hashes = content_hashes(import_df).tolist()
+    for position, (transaction_id, key) in enumerate(zip(import_df['id'], hashes)):
+        if matched[key] < counts.get(key, 0):
+            matched[key] += 1
+            skipped += 1
+        elif transaction_id in seen_ids:
+            conflicts.append(transaction_id)
+        else:
+            keep[position] = True
+            seen_ids.add(transaction_id)
+    return keep, skipped, conflicts
+
+
+def _make_cache_entry(signature, df, invalid, problems, monthly=None, hashes=None, days=None):
+    """Build a cache entry, sorting the typed rows by date for range queries
+    
+    When the day numbers of an already sorted df are given, it is used as is.
+    """
+    if days is None:
+        # Stable, so rows of the same day keep the order they were added in
+        df = df.sort_values('date', kind='stable', ignore_index=True)
+        days = _day_numbers(df)
+    return {
+        'signature': signature,
+        'df': df,
+        'days': days,
+        'invalid': invalid,
+        'problems': problems,
+        'monthly': monthly,
+        'hashes': hashes
+    }
+
+
+def _day_numbers(df):
+    """Get the int64 days since the epoch of typed rows' dates"""
+    return df['date'].to_numpy().astype('datetime64[D]').astype(np.int64)
+
+
+def _merge_sorted(df, days, new_df):
+    """Insert typed rows into the date-sorted df without sorting it again
+    
+    days are the day numbers of df. New rows go after existing rows of the
+    same day, as a stable sort would put them. Returns the merged frame
+    and its day numbers.
+    """
+    new_df = new_df.sort_values('date', kind='stable', ignore_index=True)
+    new_days = _day_numbers(new_df)
+    positions = np.searchsorted(days, new_days, 'right')
+    
+    # Positions in the concatenated frame, new rows spliced in at their dates
+    order = np.insert(np.arange(len(df)), positions, np.arange(len(df), len(df) + len(new_df)))
+    
+    # Share categories so concat keeps the columns categorical, without
+    # re-encoding the existing rows
+    new_df = new_df.copy()
+    df = df.copy(deep=False)
+    for column in CATEGORICAL_COLUMNS:
+        existing = df[column].astype('category')
+        added = new_df[column].astype(str)
+        missing = pd.Index(added.unique()).difference(existing.cat.categories)
+        if len(missing):
+            existing = existing.cat.add_categories(missing)
+        df[column] = existing
+        new_df[column] = added.astype(existing.dtype)
+    
+    merged = pd.concat([df, new_df], ignore_index=True).take(order).reset_index(drop=True)
+    return merged, np.insert(days, positions, new_days)
+
+
+def _day_number(value):
+    """Convert a date-like value to days since the epoch"""
+    return np.datetime64(pd.Timestamp(value).date(), 'D').astype(np.int64)
+
+
+def _date_slice(entry, start_date=None, end_date=None):
+    """Get the cached rows dated within [start_date, end_date] by binary search"""
+    days = entry['days']
+    start = 0 if start_date is None else np.searchsorted(days, _day_number(start_date), 'left')
+    end = len(days) if end_date is None else np.searchsorted(days, _day_number(end_date), 'right')
+    return entry['df'].iloc[start:end]
+
+
+def _to_records(df):
+    """Convert typed rows to dicts, with dates formatted as YYYY-MM-DD strings"""
+    return to_storage_frame(df).to_dict('records')
+
+
+def _to_result(df, as_columns=False):
+    """Convert typed rows to dict records, or to NumPy columns if as_columns is set"""
+    if as_columns:
+        return TransactionColumns.from_frame(df)
+    return _to_records(df)
+
+
+def _rollup_keys(df):
+    """Get (year, month, type, amount) columns of typed rows for the rollup"""
+    frame = pd.DataFrame({
+        'year': df['date'].dt.year,
+        'month': df['date'].dt.month,
+        'type': df['type'].astype(str),
+        'amount': df['amount']
+    })
+    return frame.dropna()
+
+
+def _build_monthly_rollup(df):
+    """Build the monthly rollup with a single groupby pass"""
+    if df.empty:
+        return {}
+    grouped = _rollup_keys(df).groupby(['year', 'month', 'type'], observed=True)['amount'].agg(
+        ['sum', 'count', 'min', 'max']
+    )
+    return {
+        (int(year), int(month), transaction_type): {
+            'sum': float(row['sum']),
+            'count': int(row['count']),
+            'min': float(row['min']),
+            'max': float(row['max'])
+        }
+        for (year, month, transaction_type), row in grouped.iterrows()
+    }
+
+
+def _update_monthly_rollup(monthly, df, added=None, removed=None):
+    """Apply added/removed rows to a rollup; df is the ledger after the change"""
+    if added is not None and not added.empty:
+        for year, month, transaction_type, amount in _rollup_keys(added).itertuples(index=False):
+            key = (int(year), int(month), transaction_type)
+            stats = monthly.get(key)
+            if stats is None:
+                monthly[key] = {'sum': amount, 'count': 1, 'min': amount, 'max': amount}
+            else:
+                stats['sum'] += amount
+                stats['count'] += 1
+                stats['min'] = min(stats['min'], amount)
+                stats['max'] = max(stats['max'], amount)
+    
+    if removed is not None and not removed.empty:
+        stale = set()
+        for year, month, transaction_type, amount in _rollup_keys(removed).itertuples(index=False):
+            key = (int(year), int(month), transaction_type)
+            stats = monthly.get(key)
+            if stats is None:
+                continue
+            stats['sum'] -= amount
+            stats['count'] -= 1
+            # min/max can't be undone incrementally, recompute those buckets
+            if stats['count'] <= 0 or amount in (stats['min'], stats['max']):
+                stale.add(key)
+        
+        if stale:
+            remaining = _rollup_keys(df)
+            for key in stale:
+                monthly.pop(key, None)
+                year, month, transaction_type = key
+                bucket = remaining['amount'][
+                    (remaining['year'] == year) &
+                    (remaining['month'] == month) &
+                    (remaining['type'] == transaction_type)
+                ]
+                if not bucket.empty:
+                    monthly[key] = {
+                        'sum': float(bucket.sum()),
+                        'count': int(bucket.size),
+                        'min': float(bucket.min()),
+                        'max': float(bucket.max())
+                    }
@@ -0,0 +1,64 @@
+"""
+Event Bus
+Publish/subscribe notifications for changes to the stored transactions
+"""
+
+# Data change event kinds
+TRANSACTIONS_ADDED = 'added'
+TRANSACTIONS_DELETED = 'deleted'
+TRANSACTIONS_IMPORTED = 'imported'
+
+
+class DataChangeEvent:
+    """Describes one change to the stored transactions"""
+
+    __slots__ = ('kind', 'ids')
+
+    def __init__(self, kind, ids=()):
+        self.kind = kind
+        self.ids = list(ids)
+
+    def __repr__(self):
+        return f"DataChangeEvent({self.kind!r}, {len(self.ids)} ids)"
+
+
+class EventBus:
+    """Delivers published events to the callbacks subscribed to their kind"""
+
+    def __init__(self):
+        self._subscribers = {}
+        self._dispatch = None
+
+    def set_dispatcher(self, dispatch):
+        """Deliver events through dispatch(deliver, event) instead of directly
+
+        Used to hand events published on a worker thread to the thread that
+        owns the subscribers, e.g. the Tk main loop.
+        """
+        self._dispatch = dispatch
+
+    def subscribe(self, callback, kind=None):
+        """Call callback(event) for events of kind, or for all events if kind is None"""
+        self._subscribers.setdefault(kind, []).append(callback)
+
+    def unsubscribe(self, callback, kind=None):
+        """Stop delivering events to a previously subscribed callback"""
+        callbacks = self._subscribers.get(kind, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def publish(self, event):
+        """Deliver an event to its subscribers, through the dispatcher if one is set"""
+        if self._dispatch is not None:
+            self._dispatch(self._deliver, event)
+        else:
+            self._deliver(event)
+
+    def _deliver(self, event):
+        """Call the subscribers of an event; one failing callback doesn't stop the rest"""
+        callbacks = self._subscribers.get(event.kind, []) + self._subscribers.get(None, [])
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Error handling {event!r}: {e}")
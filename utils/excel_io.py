@@ -0,0 +1,107 @@
+"""
+Excel I/O
+Streaming reads and writes of large workbooks without holding them whole
+"""
+import pandas as pd
+
+# Rows per DataFrame yielded by read_excel_chunks(), and per slice written
+CHUNK_ROWS = 20000
+
+
+def read_excel_chunks(filename, chunk_rows=CHUNK_ROWS):
+    """Yield the first sheet of a workbook as DataFrames of up to chunk_rows rows
+
+    The first row is the header. Uses openpyxl's read-only mode, which
+    streams rows from the file instead of building every cell in memory.
+    Fully empty rows are skipped. A sheet without data rows yields one
+    empty frame, so callers still see its columns.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(filename, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        columns = [str(name) if name is not None else f'Unnamed: {index}'
+                   for index, name in enumerate(header)]
+        width = len(columns)
+
+        chunk = []
+        yielded = False
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            # Read-only rows can be ragged, line them up with the header
+            row = tuple(row[:width]) + (None,) * (width - len(row))
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                yield pd.DataFrame.from_records(chunk, columns=columns)
+                yielded = True
+                chunk = []
+
+        if chunk or not yielded:
+            yield pd.DataFrame.from_records(chunk, columns=columns)
+    finally:
+        workbook.close()
+
+
+def write_excel(df, filename):
+    """Write a DataFrame to the first sheet of a new workbook, streaming rows
+
+    See write_excel_sheets().
+    """
+    write_excel_sheets({'Sheet1': df}, filename)
+
+
+def write_excel_sheets(sheets, filename):
+    """Write a dict of sheet name -> DataFrame to a new workbook, streaming rows
+
+    Uses xlsxwriter's constant-memory mode when it is installed, otherwise
+    openpyxl's write-only mode. Either way rows are flushed to the file as
+    they are written instead of building every cell in memory. Missing
+    values and empty strings are left as empty cells, as read_excel
+    reads them back as NaN.
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        xlsxwriter = None
+
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        try:
+            for name, df in sheets.items():
+                sheet = workbook.add_worksheet(name)
+                for row_number, row in enumerate(_sheet_rows(df)):
+                    sheet.write_row(row_number, 0, row)
+        finally:
+            workbook.close()
+        return
+
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for name, df in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in _sheet_rows(df):
+            sheet.append(row)
+    workbook.save(filename)
+
+
+def _sheet_rows(df, chunk_rows=CHUNK_ROWS):
+    """Yield the header and then the rows of a DataFrame as plain Python values
+
+    Rows are converted chunk_rows at a time, so only one slice of the frame
+    exists as Python objects while it is written.
+    """
+    yield [str(column) for column in df.columns]
+    for start in range(0, len(df), chunk_rows):
+        part = df.iloc[start:start + chunk_rows]
+        # Convert column by column, then zip, rather than converting each cell
+        yield from zip(*[_plain_cells(part[column]) for column in part.columns])
+
+
+def _plain_cells(values):
+    """Convert a column to a list of plain Python cell values, None for empty cells"""
+    values = values.astype(object)
+    return values.where(values.notna() & (values != ''), None).tolist()
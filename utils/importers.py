@@ -0,0 +1,178 @@
+"""
+Importers
+Readers for the statement formats the app can import, keyed by file extension
+"""
+import os
+import re
+import pandas as pd
+from utils.excel_io import read_excel_chunks
+
+# Rows per DataFrame yielded by read_csv_chunks()
+CSV_CHUNK_ROWS = 20000
+
+# Category given to bank statement rows that don't name one, as for manual entries
+DEFAULT_CATEGORY = 'General'
+
+# Amounts whose commas are unambiguous: thousands groups, or a decimal comma
+_THOUSANDS_AMOUNT = r'[+-]?\d{1,3}(?:,\d{3})+(?:\.\d*)?'
+_DECIMAL_COMMA_AMOUNT = r'[+-]?\d+,\d{1,2}'
+
+# <TAG>value pairs inside an OFX transaction, for both SGML and XML files
+_OFX_FIELD = re.compile(r'<([A-Z0-9.]+)>([^<\r\n]*)')
+_OFX_TRANSACTION = re.compile(r'<STMTTRN>(.*?)(?=</STMTTRN>|<STMTTRN>|</BANKTRANLIST>)',
+                              re.DOTALL | re.IGNORECASE)
+
+
+def read_csv_chunks(filename, chunk_rows=CSV_CHUNK_ROWS):
+    """Yield a CSV statement as DataFrames of up to chunk_rows rows
+
+    Every column is read as text, so pandas skips type inference and
+    malformed amounts or dates are reported by the schema check instead
+    of failing the read. Headers are matched case-insensitively. Files
+    without a 'type' column are treated as bank exports with signed
+    amounts, negative for expenses.
+    """
+    reader = pd.read_csv(filename, dtype=str, chunksize=chunk_rows,
+                         skipinitialspace=True, encoding='utf-8-sig')
+    with reader:
+        for chunk in reader:
+            chunk.columns = chunk.columns.str.strip().str.lower()
+            if 'amount' in chunk.columns:
+                chunk['amount'] = _amount_text(chunk['amount'])
+                if 'type' not in chunk.columns:
+                    amounts = pd.to_numeric(chunk['amount'], errors='coerce')
+                    chunk = chunk.assign(**_signed_columns(amounts))
+            if 'category' not in chunk.columns:
+                chunk['category'] = DEFAULT_CATEGORY
+            yield chunk
+
+
+def read_ofx(filename):
+    """Yield the transactions of an OFX or QFX statement as one DataFrame
+
+    Reads the STMTTRN records of both SGML (OFX 1.x) and XML (OFX 2.x)
+    files. The payee NAME becomes the description and MEMO the notes.
+    """
+    with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+
+    dates, descriptions, amounts, notes = [], [], [], []
+    for block in _OFX_TRANSACTION.findall(text):
+        fields = {tag.upper(): value.strip() for tag, value in _OFX_FIELD.findall(block)}
+        # DTPOSTED is YYYYMMDD followed by an optional time and zone
+        dates.append(fields.get('DTPOSTED', '')[:8])
+        descriptions.append(fields.get('NAME') or fields.get('MEMO') or '')
+        # OFX allows a decimal comma and has no thousands separator
+        amounts.append(fields.get('TRNAMT', '').replace(',', '.') or None)
+        notes.append(fields.get('MEMO', '') if fields.get('NAME') else '')
+
+    yield _statement_frame(pd.to_datetime(pd.Series(dates, dtype=object),
+                                          format='%Y%m%d', errors='coerce'),
+                           descriptions, amounts, [DEFAULT_CATEGORY] * len(dates), notes)
+
+
+def read_qif(filename):
+    """Yield the transactions of a QIF statement as one DataFrame
+
+    Each record is a run of lines keyed by their first letter and ended by
+    '^': D date, T (or U) amount, P payee, M memo and L category. Only the
+    top level of 'Category:Subcategory' is kept, and transfers to other
+    accounts ('[Account]') get the default category.
+    """
+    dates, descriptions, amounts, categories, notes = [], [], [], [], []
+    record = {}
+    with open(filename, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            if not line or line.startswith('!'):
+                continue
+            code, value = line[0], line[1:].strip()
+            if code != '^':
+                # Keep the first value, split lines (S, E, $) repeat codes
+                record.setdefault(code, value)
+                continue
+            if 'D' in record:
+                # Quicken writes years after 2000 as 1/5'24
+                dates.append(record['D'].replace("'", '/').replace(' ', ''))
+                descriptions.append(record.get('P') or record.get('M', ''))
+                amounts.append(record.get('T', record.get('U')))
+                category = record.get('L', '').split(':')[0].strip()
+                if not category or category.startswith('['):
+                    category = DEFAULT_CATEGORY
+                categories.append(category)
+                notes.append(record.get('M', '') if record.get('P') else '')
+            record = {}
+
+    yield _statement_frame(pd.Series(dates, dtype=object), descriptions,
+                           _amount_text(pd.Series(amounts, dtype=object)), categories, notes)
+
+
+def _amount_text(values):
+    """Rewrite amount strings with commas into plain decimal numbers
+
+    Commas grouping thousands, as in -1,234.50, are removed and a comma
+    before one or two final digits, as in -45,20, becomes the decimal
+    point. Other amounts with commas are left as they are, so the schema
+    check reports them as malformed instead of guessing.
+    """
+    text = values.str.strip()
+    thousands = text.str.fullmatch(_THOUSANDS_AMOUNT).fillna(False).astype(bool)
+    decimal_comma = text.str.fullmatch(_DECIMAL_COMMA_AMOUNT).fillna(False).astype(bool)
+    text = text.mask(thousands, text.str.replace(',', '', regex=False))
+    return text.mask(decimal_comma, text.str.replace(',', '.', regex=False))
+
+
+def _statement_frame(dates, descriptions, amounts, categories, notes):
+    """Build import rows from bank statement fields with signed amounts"""
+    amounts = pd.to_numeric(pd.Series(amounts, dtype=object), errors='coerce')
+    return pd.DataFrame({
+        'date': dates,
+        'description': descriptions,
+        'category': categories,
+        'notes': notes,
+        **_signed_columns(amounts)
+    })
+
+
+def _signed_columns(amounts):
+    """Split signed amounts into positive 'amount' and 'expense'/'income' 'type'"""
+    return {
+        'amount': amounts.abs(),
+        'type': amounts.lt(0).map({True: 'expense', False: 'income'})
+    }
+
+
+IMPORTERS = {
+    '.xlsx': read_excel_chunks,
+    '.csv': read_csv_chunks,
+    '.ofx': read_ofx,
+    '.qfx': read_ofx,
+    '.qif': read_qif,
+}
+
+# File dialog filters matching the registered importers
+FILE_TYPES = [
+    ("Supported files", "*.xlsx *.csv *.ofx *.qfx *.qif"),
+    ("Excel files", "*.xlsx"),
+    ("CSV files", "*.csv"),
+    ("Bank statements", "*.ofx *.qfx *.qif"),
+    ("All files", "*.*"),
+]
+
+
+def get_importer(filename):
+    """Get the reader registered for a file's extension"""
+    extension = os.path.splitext(filename)[1].lower()
+    reader = IMPORTERS.get(extension)
+    if reader is None:
+        raise ValueError(f"Unsupported file type '{extension}' for {os.path.basename(filename)}")
+    return reader
+
+
+def read_statement(filename):
+    """Read a whole file with its registered importer into a list of DataFrames
+
+    A module-level function, so a process pool can run it for several files.
+    The whole file is held in memory, unlike streaming the reader directly.
+    """
+    return list(get_importer(filename)(filename))
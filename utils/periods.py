@@ -0,0 +1,28 @@
+"""
+Month Periods
+Calendar-correct (year, month) arithmetic shared by analytics and predictions
+"""
+import calendar
+from datetime import datetime
+
+
+def shift_month(year, month, offset):
+    """Move (year, month) by offset months, e.g. (2024, 1, -1) -> (2023, 12)"""
+    index = year * 12 + (month - 1) + offset
+    return index // 12, index % 12 + 1
+
+
+def last_n_months(n, today=None):
+    """Get the last n (year, month) keys ending with the current month, oldest first"""
+    today = today or datetime.now()
+    return [shift_month(today.year, today.month, -i) for i in range(n - 1, -1, -1)]
+
+
+def days_in_month(year, month):
+    """Get the number of days in a month"""
+    return calendar.monthrange(year, month)[1]
+
+
+def month_label(year, month, fmt='%B %Y'):
+    """Format a (year, month) key for display"""
+    return datetime(year, month, 1).strftime(fmt)
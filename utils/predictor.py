@@ -1,27 +1,43 @@
 """
 Financial Predictor - ML-based expense/income prediction
 """
-from datetime import datetime, timedelta
+from datetime import datetime
+from statistics import NormalDist
 import numpy as np
-from sklearn.linear_model import LinearRegression
+import pandas as pd
+from utils.periods import days_in_month as month_length, month_label, shift_month
 
 
 class FinancialPredictor:
     """Predicts financial outcomes based on historical data"""
     
+    # Complete past months needed before the regression forecast is used
+    MIN_HISTORY_MONTHS = 2
+    
     def __init__(self, db_manager):
         self.db_manager = db_manager
+        
+        # Fitted forecast models, refit only when the data or month changes
+        self._model_key = None
+        self._models = None
     
-    def predict_month_survival(self):
+    def predict_month_survival(self, df=None, totals=None):
         """
         Predict if user can survive the current month based on patterns
         Returns dict with prediction, confidence, and details
+        df: optional typed transactions frame, loaded from the database if omitted
+        totals: optional per-month aggregates of df, as from _monthly_totals()
         """
-        # Get data for current and previous months
-        current_month_data = self._get_month_data(0)
-        previous_month_data = self._get_month_data(1)
+        if df is None:
+            df = self.db_manager.get_transactions_frame()
         
-        if not current_month_data['transactions']:
+        # Get data for current and previous months from one aggregation
+        if totals is None:
+            totals = self._monthly_totals(df)
+        current_month_data = self._get_month_data(0, totals)
+        previous_month_data = self._get_month_data(1, totals)
+        
+        if not current_month_data['count']:
             return {
                 'can_survive': None,
                 'confidence': 0,
@@ -42,10 +58,15 @@ class FinancialPredictor:
         daily_expense_avg = current_expenses / days_passed
         daily_income_avg = current_income / days_passed
         
-        # Project for rest of month
+        # Project for rest of month, preferring the regression forecast
         days_remaining = current_month_data['days_in_month'] - days_passed
-        projected_expenses = current_expenses + (daily_expense_avg * days_remaining)
-        projected_income = current_income + (daily_income_avg * days_remaining)
+        forecast = self.forecast_month_end(df)
+        if forecast is not None:
+            projected_expenses = forecast['projected_expenses']
+            projected_income = forecast['projected_income']
+        else:
+            projected_expenses = current_expenses + (daily_expense_avg * days_remaining)
+            projected_income = current_income + (daily_income_avg * days_remaining)
         projected_balance = projected_income - projected_expenses
         
         # Determine survival
@@ -56,7 +77,7 @@ class FinancialPredictor:
         
         # Add previous month comparison if available
         trend_message = ""
-        if previous_month_data['transactions']:
+        if previous_month_data['count']:
             prev_balance = previous_month_data['total_income'] - previous_month_data['total_expenses']
             if current_balance > prev_balance:
                 trend_message = "Your financial situation is improving compared to last month."
@@ -84,20 +105,136 @@ class FinancialPredictor:
                 'days_passed': days_passed,
                 'days_remaining': days_remaining,
                 'projected_total_expenses': projected_expenses,
-                'projected_total_income': projected_income
+                'projected_total_income': projected_income,
+                'method': 'regression' if forecast is not None else 'daily_average',
+                'balance_interval': forecast['balance_interval'] if forecast is not None else None
             }
         }
     
-    def get_spending_trend(self, months=3):
+    def forecast_month_end(self, df=None, confidence_level=0.9):
+        """
+        Forecast month-end expense and income totals with linear regression
+        fitted on the cumulative daily curves of past complete months.
+        Returns dict with projections and prediction intervals, or None
+        when there are fewer than MIN_HISTORY_MONTHS months of history.
+        df: optional typed transactions frame, loaded from the database if omitted
+        """
+        if df is None:
+            df = self.db_manager.get_transactions_frame()
+        
+        today = datetime.now()
+        models = self._get_models(df, today)
+        if models is None:
+            return None
+        
+        # Current month's cumulative totals up to today
+        day = today.day
+        days_total = month_length(today.year, today.month)
+        month_df = df[(df['date'].dt.year == today.year) &
+                      (df['date'].dt.month == today.month) &
+                      (df['date'].dt.day <= day)]
+        is_income = month_df['type'] == 'income'
+        z = NormalDist().inv_cdf((1 + confidence_level) / 2)
+        
+        result = {'confidence_level': confidence_level, 'months_used': models['months']}
+        spreads = {}
+        for kind, to_date in (('expenses', month_df.loc[~is_income, 'amount'].sum()),
+                              ('income', month_df.loc[is_income, 'amount'].sum())):
+            model = models[kind]
+            features = _curve_features(np.array([float(to_date)]),
+                                       np.array([day]), np.array([days_total]))
+            # Nothing already spent or earned can be un-spent
+            projected = max(float(model['regression'].predict(features)[0]), float(to_date))
+            
+            # Residual spread of past months at the same day, else overall
+            same_day = model['residuals'][model['days'] == day]
+            sigma = float(np.std(same_day)) if same_day.size >= 2 else model['sigma']
+            spreads[kind] = sigma
+            
+            result[f'projected_{kind}'] = projected
+            result[f'{kind}_interval'] = (max(float(to_date), projected - z * sigma),
+                                          projected + z * sigma)
+        
+        balance = result['projected_income'] - result['projected_expenses']
+        balance_sigma = float(np.hypot(spreads['expenses'], spreads['income']))
+        result['projected_balance'] = balance
+        result['balance_interval'] = (balance - z * balance_sigma, balance + z * balance_sigma)
+        return result
+    
+    def _get_models(self, df, today):
+        """Get the fitted forecast models, refitting only when data has changed"""
+        key = (self.db_manager.get_data_version(), today.year, today.month)
+        if key != self._model_key:
+            self._models = self._fit_models(df, today)
+            self._model_key = key
+        return self._models
+    
+    def _fit_models(self, df, today):
+        """Fit one regression per transaction type on past months' daily curves"""
+        # scikit-learn takes seconds to import, so only load it when fitting
+        from sklearn.linear_model import LinearRegression
+        
+        # Only complete months before the current one are training data
+        month_start = pd.Timestamp(today.year, today.month, 1)
+        history = df[df['date'] < month_start]
+        if history.empty:
+            return None
+        
+        first = history['date'].min()
+        months = [shift_month(first.year, first.month, i)
+                  for i in range((today.year - first.year) * 12 + today.month - first.month)]
+        if len(months) < self.MIN_HISTORY_MONTHS:
+            return None
+        
+        month_index = {key: i for i, key in enumerate(months)}
+        lengths = np.array([month_length(year, month) for year, month in months])
+        rows = (history['date'].dt.year.to_numpy() * 12 + history['date'].dt.month.to_numpy()
+                - (months[0][0] * 12 + months[0][1]))
+        cols = history['date'].dt.day.to_numpy() - 1
+        is_income = (history['type'] == 'income').to_numpy()
+        amounts = history['amount'].to_numpy(dtype=float)
+        
+        models = {'months': len(month_index)}
+        for kind, mask in (('expenses', ~is_income), ('income', is_income)):
+            # Daily totals as a months x 31 grid, then cumulative along days
+            daily = np.zeros((len(months), 31))
+            np.add.at(daily, (rows[mask], cols[mask]), amounts[mask])
+            cumulative = np.cumsum(daily, axis=1)
+            
+            # One sample per (month, day) that exists in that month
+            day_numbers = np.arange(1, 32)
+            valid = day_numbers[None, :] <= lengths[:, None]
+            month_rows, day_cols = np.nonzero(valid)
+            to_date = cumulative[month_rows, day_cols]
+            totals = cumulative[month_rows, lengths[month_rows] - 1]
+            days = day_cols + 1
+            
+            features = _curve_features(to_date, days, lengths[month_rows])
+            regression = LinearRegression().fit(features, totals)
+            residuals = totals - regression.predict(features)
+            models[kind] = {
+                'regression': regression,
+                'residuals': residuals,
+                'days': days,
+                'sigma': float(np.std(residuals))
+            }
+        
+        return models
+    
+    def get_spending_trend(self, months=3, df=None, totals=None):
         """
         Get spending trend for the past N months
-        Returns list of (month_name, total_expenses, total_income) tuples
+        Returns list of {'month', 'expenses', 'income', 'balance'} dicts, oldest first
+        df: optional typed transactions frame, loaded from the database if omitted
+        totals: optional per-month aggregates of df, as from _monthly_totals()
         """
+        if totals is None:
+            totals = self._monthly_totals(df)
         trend_data = []
         
         for i in range(months):
-            month_data = self._get_month_data(i)
-            if month_data['transactions']:
+            month_data = self._get_month_data(i, totals)
+            if month_data['count']:
                 trend_data.append({
                     'month': month_data['month_name'],
                     'expenses': month_data['total_expenses'],
@@ -107,23 +244,39 @@ class FinancialPredictor:
         
         return list(reversed(trend_data))  # Oldest first
     
-    def _get_month_data(self, months_ago=0):
+    def _monthly_totals(self, df=None):
+        """
+        Aggregate income/expense totals and transaction counts per month
+        in a single groupby pass. Returns a DataFrame indexed by (year, month).
+        """
+        if df is None:
+            df = self.db_manager.get_transactions_frame()
+        
+        is_income = (df['type'] == 'income').to_numpy()
+        amounts = df['amount'].to_numpy(dtype=float)
+        frame = pd.DataFrame({
+            'year': df['date'].dt.year,
+            'month': df['date'].dt.month,
+            'income': np.where(is_income, amounts, 0.0),
+            'expenses': np.where(is_income, 0.0, amounts)
+        })
+        
+        return frame.groupby(['year', 'month']).agg(
+            income=('income', 'sum'),
+            expenses=('expenses', 'sum'),
+            count=('income', 'size')
+        )
+    
+    def _get_month_data(self, months_ago, totals):
         """
         Get aggregated data for a specific month
         months_ago: 0 = current month, 1 = last month, etc.
+        totals: per-month aggregates from _monthly_totals()
         """
-        # Calculate target month
+        # Calculate target month with calendar arithmetic, not 30-day steps
         today = datetime.now()
-        target_date = today - timedelta(days=30 * months_ago)
-        target_month = target_date.month
-        target_year = target_date.year
-        
-        # Get days in month
-        if target_month == 12:
-            next_month = datetime(target_year + 1, 1, 1)
-        else:
-            next_month = datetime(target_year, target_month + 1, 1)
-        days_in_month = (next_month - datetime(target_year, target_month, 1)).days
+        target_year, target_month = shift_month(today.year, today.month, -months_ago)
+        days_in_month = month_length(target_year, target_month)
         
         # Calculate days passed in month
         if months_ago == 0:
@@ -131,31 +284,29 @@ class FinancialPredictor:
         else:
             days_passed = days_in_month
         
-        # Get all transactions
-        all_transactions = self.db_manager.get_all_transactions()
-        
-        # Filter for target month
-        month_transactions = []
-        total_income = 0
-        total_expenses = 0
-        
-        for trans in all_transactions:
-            try:
-                trans_date = datetime.strptime(trans['date'], '%Y-%m-%d')
-                if trans_date.month == target_month and trans_date.year == target_year:
-                    month_transactions.append(trans)
-                    if trans['type'] == 'income':
-                        total_income += trans['amount']
-                    else:
-                        total_expenses += trans['amount']
-            except:
-                continue
+        # Look up the precomputed totals for the target month
+        key = (target_year, target_month)
+        if key in totals.index:
+            row = totals.loc[key]
+            total_income = float(row['income'])
+            total_expenses = float(row['expenses'])
+            count = int(row['count'])
+        else:
+            total_income = 0.0
+            total_expenses = 0.0
+            count = 0
         
         return {
-            'month_name': target_date.strftime('%B %Y'),
-            'transactions': month_transactions,
+            'month_name': month_label(target_year, target_month),
+            'count': count,
             'total_income': total_income,
             'total_expenses': total_expenses,
             'days_in_month': days_in_month,
             'days_passed': days_passed
         }
+
+
+def _curve_features(to_date, days, days_in_month):
+    """Regression features: amount so far, its naive extrapolation, days left"""
+    remaining = days_in_month - days
+    return np.column_stack([to_date, to_date * remaining / days, remaining])
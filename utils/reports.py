@@ -0,0 +1,109 @@
+"""
+Reports
+Summary sheets for the monthly report workbook
+"""
+import numpy as np
+import pandas as pd
+from utils.periods import month_label
+
+# Months of history on the Trend sheet
+TREND_MONTHS = 6
+
+
+def daily_totals(df):
+    """Aggregate typed transactions into per-day income/expense sums and counts
+
+    The summary sheets are derived from the much smaller per-day table it
+    returns, indexed by date, rather than from the ledger rows. Only the
+    projection's regression forecast reads the ledger again.
+    """
+    is_income = (df['type'] == 'income').to_numpy()
+    amounts = df['amount'].to_numpy(dtype=float)
+    frame = pd.DataFrame({
+        'date': df['date'].to_numpy(),
+        'income': np.where(is_income, amounts, 0.0),
+        'expenses': np.where(is_income, 0.0, amounts),
+        'income_count': is_income.astype(np.int64),
+        'expense_count': (~is_income).astype(np.int64)
+    })
+    return frame.groupby('date').sum()
+
+
+def monthly_totals(daily):
+    """Roll per-day totals up to (year, month), in the shape the predictor uses
+
+    The result has the 'income', 'expenses' and 'count' columns of
+    FinancialPredictor._monthly_totals(), plus the per-type counts.
+    """
+    dates = pd.DatetimeIndex(daily.index)
+    monthly = daily.groupby([dates.year.rename('year'), dates.month.rename('month')]).sum()
+    monthly['count'] = monthly['income_count'] + monthly['expense_count']
+    return monthly
+
+
+def build_report_sheets(ledger, df, predictor):
+    """Build the report workbook's sheets as a dict of sheet name -> DataFrame
+
+    ledger: the storage frame written as the raw 'Transactions' sheet
+    df: the typed transactions the summaries are computed from
+    predictor: a FinancialPredictor for the trend and month-end projection,
+        whose regression forecast fits on df itself
+    """
+    daily = daily_totals(df)
+    monthly = monthly_totals(daily)
+
+    months = [month_label(int(year), int(month)) for year, month in monthly.index]
+    monthly_sheet = pd.DataFrame({
+        'Month': months,
+        'Income': monthly['income'].to_numpy(),
+        'Expenses': monthly['expenses'].to_numpy(),
+        'Balance': (monthly['income'] - monthly['expenses']).to_numpy(),
+        'Income Transactions': monthly['income_count'].to_numpy(),
+        'Expense Transactions': monthly['expense_count'].to_numpy()
+    })
+
+    net = daily['income'] - daily['expenses']
+    daily_sheet = pd.DataFrame({
+        'Date': pd.DatetimeIndex(daily.index).strftime('%Y-%m-%d'),
+        'Income': daily['income'].to_numpy(),
+        'Expenses': daily['expenses'].to_numpy(),
+        'Net': net.to_numpy(),
+        'Running Balance': net.cumsum().to_numpy()
+    })
+
+    trend = predictor.get_spending_trend(months=TREND_MONTHS, df=df, totals=monthly)
+    trend_sheet = pd.DataFrame(trend, columns=['month', 'expenses', 'income', 'balance'])
+    trend_sheet.columns = ['Month', 'Expenses', 'Income', 'Balance']
+
+    return {
+        'Transactions': ledger,
+        'Monthly Summary': monthly_sheet,
+        'Daily Balance': daily_sheet,
+        'Trend': trend_sheet,
+        'Projection': _projection_sheet(predictor.predict_month_survival(df, totals=monthly))
+    }
+
+
+def _projection_sheet(prediction):
+    """Lay out a month survival prediction as Metric/Value rows"""
+    details = prediction['details']
+    rows = [('Prediction', prediction['message']),
+            ('Confidence (%)', prediction['confidence'])]
+    if prediction.get('trend'):
+        rows.append(('Trend', prediction['trend']))
+    if details:
+        rows += [
+            ('Current Balance', details['current_balance']),
+            ('Projected Income', details['projected_total_income']),
+            ('Projected Expenses', details['projected_total_expenses']),
+            ('Projected Balance', details['projected_balance']),
+            ('Daily Expense Average', details['daily_expense_avg']),
+            ('Daily Income Average', details['daily_income_avg']),
+            ('Days Passed', details['days_passed']),
+            ('Days Remaining', details['days_remaining']),
+            ('Method', details['method'])
+        ]
+        if details['balance_interval'] is not None:
+            low, high = details['balance_interval']
+            rows += [('Projected Balance Low', low), ('Projected Balance High', high)]
+    return pd.DataFrame(rows, columns=['Metric', 'Value'])
@@ -0,0 +1,77 @@
+"""
+Query Results
+Column-oriented results for DatabaseManager read APIs
+"""
+import numpy as np
+from utils.storage import TRANSACTION_COLUMNS
+
+_DATE_POSITION = TRANSACTION_COLUMNS.index('date')
+
+
+class TransactionRow:
+    """One transaction, supporting both row.amount and row['amount'] access"""
+
+    __slots__ = tuple(TRANSACTION_COLUMNS)
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __repr__(self):
+        return f"TransactionRow({self.id!r}, {self.date!r}, {self.amount!r}, {self.type!r})"
+
+
+class TransactionColumns:
+    """Transactions as one NumPy array per column
+
+    'date' is datetime64[D], 'amount' float64 and the text columns are
+    object arrays, so aggregations run on whole columns without building a
+    Python object per row. Iterating yields TransactionRow objects, built
+    on demand, with dates formatted as YYYY-MM-DD strings like the dict
+    records returned by default.
+    """
+
+    __slots__ = ('_columns', '_length')
+
+    def __init__(self, columns):
+        self._columns = columns
+        self._length = len(columns['id'])
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the columns of a typed transactions frame"""
+        columns = {}
+        for name in TRANSACTION_COLUMNS:
+            if name == 'date':
+                columns[name] = df[name].to_numpy().astype('datetime64[D]')
+            elif name == 'amount':
+                columns[name] = df[name].to_numpy(dtype=np.float64)
+            else:
+                columns[name] = df[name].to_numpy(dtype=object)
+        return cls(columns)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, name):
+        """Get a column array by name"""
+        return self._columns[name]
+
+    def __iter__(self):
+        for index in range(self._length):
+            yield self.row(index)
+
+    def row(self, index):
+        """Build the TransactionRow at a position"""
+        values = [self._columns[name][index] for name in TRANSACTION_COLUMNS]
+        values[_DATE_POSITION] = str(values[_DATE_POSITION])
+        return TransactionRow(*values)
+
+    def where(self, mask):
+        """Get the rows selected by a boolean mask as new columns"""
+        return TransactionColumns({name: column[mask] for name, column in self._columns.items()})
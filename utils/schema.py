@@ -0,0 +1,92 @@
+"""
+Transaction Schema
+Normalizes raw storage rows into a typed DataFrame and back
+"""
+import pandas as pd
+from utils.storage import TRANSACTION_COLUMNS
+
+TRANSACTION_TYPES = ('expense', 'income')
+DATE_FORMAT = '%Y-%m-%d'
+CATEGORICAL_COLUMNS = ('type', 'category')
+
+
+def parse_dates(values):
+    """Parse a date column to datetime64, leaving unparsable values as NaT"""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.normalize()
+    # Fast path for the format the app writes, then fall back for the rest
+    parsed = pd.to_datetime(values, format=DATE_FORMAT, errors='coerce')
+    retry = parsed.isna() & values.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(
+            values[retry].astype(str), format='mixed', errors='coerce'
+        )
+    return parsed.dt.normalize()
+
+
+def normalize_transactions(df):
+    """Split raw rows into a typed frame of valid rows and the malformed rest
+
+    The typed frame has datetime64 dates, float64 amounts and categorical
+    'type' and 'category' columns. Returns (typed_df, invalid_df, problems),
+    where invalid_df keeps the malformed rows exactly as they were read and
+    problems lists one dict per malformed row.
+    """
+    raw = df.reindex(columns=TRANSACTION_COLUMNS).reset_index(drop=True)
+
+    dates = parse_dates(raw['date'])
+    amounts = pd.to_numeric(raw['amount'], errors='coerce').astype('float64')
+    types = raw['type'].astype('string').str.strip().str.lower()
+
+    bad_date = dates.isna()
+    bad_amount = amounts.isna()
+    bad_type = ~types.isin(TRANSACTION_TYPES).fillna(False).astype(bool)
+    invalid = bad_date | bad_amount | bad_type
+
+    problems = []
+    if invalid.any():
+        for position in invalid[invalid].index:
+            reasons = []
+            if bad_date[position]:
+                reasons.append(f"invalid date {raw.at[position, 'date']!r}")
+            if bad_amount[position]:
+                reasons.append(f"invalid amount {raw.at[position, 'amount']!r}")
+            if bad_type[position]:
+                reasons.append(f"invalid type {raw.at[position, 'type']!r}")
+            problems.append({
+                'row': int(position) + 1,
+                'id': raw.at[position, 'id'],
+                'problems': reasons
+            })
+
+    valid = ~invalid
+    typed = pd.DataFrame({
+        'id': raw['id'][valid].astype(str),
+        'date': dates[valid],
+        'description': raw['description'][valid].fillna('').astype(str),
+        'category': raw['category'][valid].fillna('General').astype(str),
+        'amount': amounts[valid],
+        'type': types[valid].astype(str),
+        'notes': raw['notes'][valid].fillna('').astype(str),
+        'created_at': raw['created_at'][valid].fillna('').astype(str)
+    }, columns=TRANSACTION_COLUMNS)
+
+    return categorize(typed.reset_index(drop=True)), df[invalid.to_numpy()], problems
+
+
+def categorize(df):
+    """Store the low-cardinality text columns as categoricals"""
+    for column in CATEGORICAL_COLUMNS:
+        df[column] = df[column].astype('category')
+    return df
+
+
+def to_storage_frame(df):
+    """Convert a typed frame back to the plain values written to storage"""
+    out = df.reindex(columns=TRANSACTION_COLUMNS).copy()
+    if pd.api.types.is_datetime64_any_dtype(out['date']):
+        out['date'] = out['date'].dt.strftime(DATE_FORMAT)
+    for column in CATEGORICAL_COLUMNS:
+        if isinstance(out[column].dtype, pd.CategoricalDtype):
+            out[column] = out[column].astype(object)
+    return out
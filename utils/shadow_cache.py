@@ -0,0 +1,121 @@
+"""
+Shadow Cache
+Binary copy of the transactions workbook that loads without openpyxl
+"""
+import os
+import json
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+
+
+class ShadowCache:
+    """Stores a storage-form DataFrame as NumPy arrays plus a string table
+
+    Numeric and datetime columns are saved as .npy arrays. Text columns are
+    saved as int32 codes into a per-column table of unique values kept in
+    strings.json, with -1 marking empty cells. meta.json records the
+    signature of the workbook the data came from and is written last, so an
+    interrupted write leaves no valid cache behind.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.meta_path = os.path.join(path, 'meta.json')
+        self.strings_path = os.path.join(path, 'strings.json')
+
+    def load(self, signature):
+        """Load the cached frame if it was stored for this source signature"""
+        if signature is None or not os.path.exists(self.meta_path):
+            return None
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != FORMAT_VERSION or meta.get('source') != list(signature):
+                return None
+            with open(self.strings_path, 'r', encoding='utf-8') as f:
+                tables = json.load(f)
+
+            data = {}
+            for index, column in enumerate(meta['columns']):
+                name = column['name']
+                # Copied out of the memory map so the files aren't held open;
+                # Windows would otherwise refuse to rewrite them
+                array = np.array(np.load(self._array_path(index), mmap_mode='r'))
+                if column['kind'] == 'table':
+                    lookup = np.empty(len(tables[str(index)]) + 1, dtype=object)
+                    lookup[:-1] = tables[str(index)]
+                    lookup[-1] = np.nan
+                    data[name] = lookup[array]
+                elif column['dtype'].startswith('datetime64'):
+                    data[name] = array.view(column['dtype'])
+                else:
+                    data[name] = array
+            return pd.DataFrame(data, columns=[column['name'] for column in meta['columns']])
+        except Exception as e:
+            print(f"Ignoring unreadable transaction cache: {e}")
+            return None
+
+    def store(self, df, signature):
+        """Write the frame for the given source signature; returns whether it was cached"""
+        if signature is None:
+            return False
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # Invalidate first, meta.json is only rewritten once all arrays are
+            self.clear()
+
+            columns = []
+            tables = {}
+            for index, name in enumerate(df.columns):
+                values = df.iloc[:, index]
+                if pd.api.types.is_bool_dtype(values) or not (
+                        pd.api.types.is_numeric_dtype(values) or
+                        pd.api.types.is_datetime64_any_dtype(values)):
+                    codes, uniques = pd.factorize(values.astype(object))
+                    uniques = [_table_value(value) for value in uniques]
+                    np.save(self._array_path(index), codes.astype(np.int32))
+                    tables[str(index)] = uniques
+                    columns.append({'name': str(name), 'kind': 'table'})
+                else:
+                    array = values.to_numpy()
+                    dtype = str(array.dtype)
+                    if dtype.startswith('datetime64'):
+                        array = array.view(np.int64)
+                    np.save(self._array_path(index), array)
+                    columns.append({'name': str(name), 'kind': 'array', 'dtype': dtype})
+
+            with open(self.strings_path, 'w', encoding='utf-8') as f:
+                json.dump(tables, f)
+            with open(self.meta_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': FORMAT_VERSION,
+                    'source': list(signature),
+                    'rows': len(df),
+                    'columns': columns
+                }, f)
+            return True
+        except Exception as e:
+            print(f"Could not write transaction cache: {e}")
+            self.clear()
+            return False
+
+    def clear(self):
+        """Invalidate the cache"""
+        if os.path.exists(self.meta_path):
+            os.remove(self.meta_path)
+
+    def _array_path(self, index):
+        """Get the .npy file for the column at a position"""
+        return os.path.join(self.path, f'column_{index}.npy')
+
+
+def _table_value(value):
+    """Check that a text column value survives a JSON round trip unchanged"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, np.generic) and not isinstance(value, np.datetime64):
+        return value.item()
+    # Dates, times and other cell types can't be cached faithfully
+    raise TypeError(f"unsupported cell value {value!r}")
@@ -0,0 +1,319 @@
+"""
+Storage Backends
+Pluggable persistence engines used by the DatabaseManager
+"""
+import os
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+import pandas as pd
+from utils.shadow_cache import ShadowCache
+from utils.excel_io import write_excel
+
+TRANSACTION_COLUMNS = [
+    'id', 'date', 'description', 'category',
+    'amount', 'type', 'notes', 'created_at'
+]
+
+
+def empty_transactions_frame():
+    """Create an empty DataFrame with the transactions schema"""
+    return pd.DataFrame(columns=TRANSACTION_COLUMNS)
+
+
+class StorageBackend:
+    """Base class for transaction storage engines
+
+    All methods take and return frames in storage form: plain strings for
+    dates and text columns, as produced by schema.to_storage_frame().
+    """
+
+    name = None
+    extension = None
+
+    # Inserts larger than this are written with save() instead of insert()
+    bulk_insert_limit = None
+
+    def __init__(self, data_dir):
+        self.path = os.path.join(data_dir, f'transactions{self.extension}')
+
+    def exists(self):
+        """Check whether the storage file has been created"""
+        return os.path.exists(self.path)
+
+    def signature(self):
+        """Get a value that changes whenever the stored data changes"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def initialize(self, df=None):
+        """Create the storage file, optionally seeded with existing rows"""
+        self.save(df if df is not None else empty_transactions_frame())
+
+    def load(self):
+        """Load all transactions as a DataFrame"""
+        raise NotImplementedError
+
+    def save(self, df):
+        """Replace all stored transactions"""
+        raise NotImplementedError
+
+    def insert(self, rows):
+        """Store new rows"""
+        raise NotImplementedError
+
+    def delete(self, ids):
+        """Remove rows by id"""
+        raise NotImplementedError
+
+    def needs_compaction(self):
+        """Check whether pending journal entries should be folded in"""
+        return False
+
+
+class ExcelStorage(StorageBackend):
+    """Stores transactions in an Excel workbook plus an append-only journal
+
+    Adds and deletes are appended to a JSON lines journal next to the
+    workbook, so they cost the same regardless of ledger size. The journal
+    is replayed on load and folded into the workbook by save().
+    
+    The workbook's contents are also kept in a binary shadow cache, so
+    loading only parses the xlsx when it was changed outside the app.
+    """
+
+    name = 'excel'
+    extension = '.xlsx'
+
+    # Bulk inserts above this size rewrite the workbook directly
+    bulk_insert_limit = 1000
+
+    def __init__(self, data_dir):
+        super().__init__(data_dir)
+        self.journal_path = os.path.join(data_dir, 'transactions.journal.jsonl')
+        self.shadow = ShadowCache(os.path.join(data_dir, 'transactions.cache'))
+
+    def signature(self):
+        """Combine the workbook and journal signatures"""
+        workbook = super().signature()
+        if workbook is None:
+            return None
+        try:
+            stat = os.stat(self.journal_path)
+        except OSError:
+            return workbook
+        return workbook + (stat.st_mtime_ns, stat.st_size)
+
+    def load(self):
+        """Load the workbook and replay any journaled changes on top"""
+        df = self._read_workbook()
+        entries = self._read_journal()
+        if not entries:
+            return df
+
+        base_ids = set(df['id'].astype(str)) if 'id' in df.columns else set()
+        added = {}
+        deleted = set()
+        for entry in entries:
+            if entry.get('op') == 'add':
+                row = entry['row']
+                # Replay is idempotent: rows already in the workbook are skipped
+                if str(row.get('id')) not in base_ids:
+                    added[str(row.get('id'))] = row
+            elif entry.get('op') == 'delete':
+                for transaction_id in entry.get('ids', []):
+                    transaction_id = str(transaction_id)
+                    added.pop(transaction_id, None)
+                    deleted.add(transaction_id)
+
+        if deleted and 'id' in df.columns:
+            df = df[~df['id'].astype(str).isin(deleted)]
+        if added:
+            added_df = pd.DataFrame(list(added.values()), columns=TRANSACTION_COLUMNS)
+            df = pd.concat([df, added_df], ignore_index=True)
+        return df.reset_index(drop=True)
+
+    def save(self, df):
+        """Rewrite the workbook and clear the journal it now contains"""
+        temp_path = os.path.splitext(self.path)[0] + '.tmp.xlsx'
+        write_excel(df, temp_path)
+        os.replace(temp_path, self.path)
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        # Cache what reading the new workbook back would return
+        self.shadow.store(_as_read_from_excel(df), super().signature())
+
+    def insert(self, rows):
+        """Journal new rows instead of rewriting the workbook"""
+        frame = rows.reindex(columns=TRANSACTION_COLUMNS)
+        self._append_journal(
+            {'op': 'add', 'row': {column: _plain_value(value)
+                                  for column, value in zip(TRANSACTION_COLUMNS, record)}}
+            for record in frame.itertuples(index=False, name=None)
+        )
+
+    def delete(self, ids):
+        """Journal a delete instead of rewriting the workbook"""
+        self._append_journal([{'op': 'delete', 'ids': [str(i) for i in ids]}])
+
+    def needs_compaction(self):
+        """Check whether the journal has entries to fold into the workbook"""
+        return os.path.exists(self.journal_path)
+
+    def _read_workbook(self):
+        """Read the workbook from the shadow cache, parsing the xlsx only if it changed"""
+        signature = super().signature()
+        df = self.shadow.load(signature)
+        if df is None:
+            df = pd.read_excel(self.path, engine='openpyxl')
+            self.shadow.store(df, signature)
+        return df
+        
+    def _read_journal(self):
+        """Read journal entries, ignoring a torn final line"""
+        if not os.path.exists(self.journal_path):
+            return []
+        entries = []
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    print(f"Skipping unreadable journal entry: {line[:80]}")
+        return entries
+
+    def _append_journal(self, entries):
+        """Append entries to the journal and flush them to disk"""
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class SQLiteStorage(StorageBackend):
+    """Stores transactions in a SQLite database with indexed lookups"""
+
+    name = 'sqlite'
+    extension = '.db'
+
+    # SQLite limits the number of bound parameters per statement
+    _DELETE_CHUNK = 500
+
+    @contextmanager
+    def _connect(self):
+        """Open a connection that commits on success and always closes"""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def initialize(self, df=None):
+        """Create the schema and indexes, optionally seeded with rows"""
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS transactions (
+                    id TEXT,
+                    date TEXT,
+                    description TEXT,
+                    category TEXT,
+                    amount REAL,
+                    type TEXT,
+                    notes TEXT,
+                    created_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_id ON transactions (id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions (date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions (type)")
+            if df is not None and not df.empty:
+                self._insert_rows(conn, df)
+
+    def load(self):
+        """Load all transactions in insertion order"""
+        columns = ', '.join(TRANSACTION_COLUMNS)
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                f"SELECT {columns} FROM transactions ORDER BY rowid", conn
+            )
+
+    def save(self, df):
+        """Replace all stored transactions"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM transactions")
+            self._insert_rows(conn, df)
+
+    def insert(self, rows):
+        """Insert new rows without touching the rest of the table"""
+        with self._connect() as conn:
+            self._insert_rows(conn, rows)
+
+    def delete(self, ids):
+        """Delete rows by id using the id index"""
+        ids = [str(transaction_id) for transaction_id in ids]
+        with self._connect() as conn:
+            for start in range(0, len(ids), self._DELETE_CHUNK):
+                chunk = ids[start:start + self._DELETE_CHUNK]
+                placeholders = ', '.join('?' * len(chunk))
+                conn.execute(
+                    f"DELETE FROM transactions WHERE id IN ({placeholders})", chunk
+                )
+
+    def _insert_rows(self, conn, df):
+        """Insert DataFrame rows using a single executemany call"""
+        columns = ', '.join(TRANSACTION_COLUMNS)
+        placeholders = ', '.join('?' * len(TRANSACTION_COLUMNS))
+        frame = df.reindex(columns=TRANSACTION_COLUMNS)
+        rows = (
+            tuple(_plain_value(value) for value in record)
+            for record in frame.itertuples(index=False, name=None)
+        )
+        conn.executemany(
+            f"INSERT INTO transactions ({columns}) VALUES ({placeholders})", rows
+        )
+
+
+def _as_read_from_excel(df):
+    """Mimic read_excel on a frame being saved: empty text cells read back as NaN"""
+    out = df.reset_index(drop=True)
+    for column in out.columns:
+        if not pd.api.types.is_numeric_dtype(out[column]):
+            out[column] = out[column].astype(object).where(out[column].astype(object) != '')
+    return out
+
+
+def _plain_value(value):
+    """Convert a pandas/NumPy cell value into a plain Python value for sqlite3/JSON"""
+    if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        if value.hour or value.minute or value.second:
+            return value.strftime('%Y-%m-%d %H:%M:%S')
+        return value.strftime('%Y-%m-%d')
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+BACKENDS = {
+    ExcelStorage.name: ExcelStorage,
+    SQLiteStorage.name: SQLiteStorage,
+}
+
+
+def create_backend(name, data_dir):
+    """Create the storage backend registered under the given name"""
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        print(f"Unknown storage backend '{name}', falling back to Excel")
+        backend_class = ExcelStorage
+    return backend_class(data_dir)